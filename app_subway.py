@@ -1,11 +1,29 @@
+import datetime
+import math
 import os
+import sqlite3
 import streamlit as st
-import csv
 import folium
-import math
 import requests
 from pathlib import Path
 
+from autocomplete import StationAutocomplete
+from contraction import CHDijkstra, ContractionHierarchy
+from geocode_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_S, GeocodeCache
+from graph_artifact import load_or_build, source_hash
+from hub_labels import HubLabels, order_from_rank
+from landmarks import load_or_build_landmarks
+from pareto import pareto_routes
+from raptor import RaptorEngine, format_clock, load_line_schedule
+from station_index import SNAP_K, StationIndex, snap_to_stations, walk_minutes
+from station_names import StationNameIndex
+from meeting import (
+    DEFAULT_LAMBDA, OBJECTIVES, best_meeting_station, find_best_meeting_station,
+    group_start_stations, top_k_meeting_stations
+)
+from subway_routing import AVG_SPEED_KMH, Dijkstra, TreeCache, get_path_distance_and_time
+from time_matrix import load_or_build_time_matrix
+
 st.set_page_config(page_title="지하철 만남 지점 추천 서비스", layout="wide")
 # =========================
 # 커스텀 CSS 스타일
@@ -105,96 +123,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# =========================
-# Dijkstra 알고리즘 클래스
-# =========================
-class Dijkstra:
-    def __init__(self, nodes):
-        self.nodes = nodes
-        self.visits = set()
-        self.graph = []
-        self.cost = {}
-        for node in self.nodes:
-            # [해당 노드까지의 최소 비용, 부모 노드]
-            self.cost[node] = [float("inf"), None]
-
-    def setEdge(self, a, b, w):
-        # a, b: 노드 ID, w: 가중치(여기서는 "시간(분)")
-        self.graph.append((a, b, w))
-
-    def getPath(self, start, end):
-        # nodes를 복사하여 사용 (원본을 변경하지 않기 위해)
-        remaining_nodes = self.nodes.copy()
-        curNode = start
-        self.cost[curNode][0] = 0
-
-        while True:
-            self.visits.add(curNode)
-            remaining_nodes.discard(curNode)
-            neighbors = self._neighbor(curNode)
-
-            # 인접 노드까지의 비용 갱신
-            for node in neighbors:
-                new_cost = self.cost[curNode][0] + self._getWeight(curNode, node)
-                if new_cost < self.cost[node][0]:
-                    self.cost[node][0] = new_cost
-                    self.cost[node][1] = curNode
-
-            if len(remaining_nodes) > 0:
-                curNode = self._dicFilter(remaining_nodes)
-                if curNode is None:
-                    break
-            else:
-                break
-
-        # start -> end 경로 복원
-        if self.cost[end][0] == float("inf"):
-            return []  # 도달 불가
-
-        path = [end]
-        temp_end = end
-        while temp_end != start:
-            parent = self.cost[temp_end][1]
-            if parent is None:
-                break
-            path.append(parent)
-            temp_end = parent
-
-        return path[::-1]
-
-    def _neighbor(self, curNode):
-        neighbor = {}
-        for node in self.graph:
-            if node[0] == curNode:
-                neighbor[node[1]] = node[2]
-            elif node[1] == curNode:
-                neighbor[node[0]] = node[2]
-        return neighbor
-
-    def _getWeight(self, n1, n2):
-        for node in self.graph:
-            if node[0] == n1 and node[1] == n2:
-                return node[2]
-            elif node[0] == n2 and node[1] == n1:
-                return node[2]
-        return None
-
-    def _dicFilter(self, remaining_nodes):
-        import sys
-        mini = sys.maxsize
-        curNode = None
-        for key, value in self.cost.items():
-            if key in remaining_nodes and value[0] < mini:
-                mini = value[0]
-                curNode = key
-        return curNode
-
-    def reset(self):
-        self.visits = set()
-        for node in self.nodes:
-            self.cost[node] = [float("inf"), None]
-
-
 # =========================
 # 전역 상수 및 설정
 # =========================
@@ -202,14 +130,27 @@ class Dijkstra:
 BASE_DIR = Path(__file__).resolve().parent
 SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
 SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
-
-
-# 지하철 평균 속도(km/h)
-AVG_SPEED_KMH = 34
-
-# Edge 별 거리/시간 저장용 전역 딕셔너리
-edge_distance = {}  # (n1, n2) -> 거리(km)
-edge_time = {}      # (n1, n2) -> 시간(분)
+GRAPH_ARTIFACT = BASE_DIR / "subway_graph.npz"  # build_graph_artifact.py로 생성
+LANDMARKS = BASE_DIR / "subway_landmarks.npz"  # build_graph_artifact.py로 생성 (ALT 탐색용)
+TIME_MATRIX = BASE_DIR / "subway_time_matrix.bin"  # build_time_matrix.py로 생성 (없으면 기동 시 생성)
+LINE_SCHEDULE_CSV = BASE_DIR / "line_schedule.csv"  # 호선별 첫차/막차/배차 간격 (출발 시각 기준 탐색용)
+GEOCODE_CACHE_DB = BASE_DIR / "geocode_cache.sqlite3"  # 카카오 장소 검색 결과 캐시 (없으면 생성)
+
+# 장소 검색 캐시 유효 기간(일)과 최대 항목 수 (환경 변수로 조정 가능)
+GEOCODE_CACHE_TTL_DAYS = float(os.getenv("GEOCODE_CACHE_TTL_DAYS", DEFAULT_TTL_S / 86400))
+GEOCODE_CACHE_MAX_ENTRIES = int(os.getenv("GEOCODE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+
+# 출발역별 최단 경로 트리 캐시 크기 (세션 간 공유)
+TREE_CACHE_SIZE = 256
+
+# 만남 인원 제한: 사람별 입력은 MAX_PEOPLE명까지, 명단 입력(대규모 모임)은 MAX_GROUP_SIZE명까지
+MAX_PEOPLE = 10
+MAX_GROUP_SIZE = 500
+# 가중치 허용 범위 (사람별 입력창과 명단 입력 공통)
+MIN_WEIGHT = 0.1
+MAX_WEIGHT = 10.0
+# 명단 첫 줄이 이 이름(또는 숫자가 아닌 가중치 열)이면 머리글로 보고 건너뛴다
+GROUP_HEADER_NAMES = {"이름", "역", "역 이름", "역이름", "출발역", "출발지", "장소", "name", "station", "origin"}
 
 # 카카오 REST API 키 
 if "KAKAO_REST_API_KEY" in st.secrets:
@@ -222,52 +163,87 @@ else:
 # =========================
 
 
-@st.cache_data
+@st.cache_resource
 def load_subway_data():
-    """지하철역 위치 및 연결 정보를 로드"""
-    global edge_distance, edge_time
-    edge_distance = {}
-    edge_time = {}
+    """
+    지하철역 위치 및 연결 정보를 로드
+    (그래프는 불변이므로 복사 없이 모든 세션이 공유, 탐색 상태는 쿼리마다 Dijkstra(graph)로 생성)
+    """
+    # 원본 CSV 해시가 아티팩트와 같으면 CSV 파싱 없이 한 번에 로드
+    subwayLoc, nodes, graph = load_or_build(SUBWAY_CSV, SUBWAY_LOCATION_CSV, GRAPH_ARTIFACT, AVG_SPEED_KMH)
+    # 역 이름 -> 호선별 노드ID 색인, 주소 -> 가까운 역 조회용 좌표 KD-tree (노선도에 있는 역만)
+    name_index = StationNameIndex(graph.names)
+    station_index = StationIndex(
+        {name: loc for name, loc in subwayLoc.items() if name_index.lookup(name)}
+    )
+    return subwayLoc, nodes, graph, station_index, name_index
 
-    subwayLoc = {}
-    nodes = set()
-    
-    # 지하철역 위치 정보 로드
-    with open(SUBWAY_LOCATION_CSV, 'r', encoding='utf-8-sig') as f:
-        rdr = csv.reader(f)
-        for line in rdr:
-            # line[0]: 역 이름, line[1]: 위도, line[2]: 경도
-            if line[0] not in subwayLoc:
-                subwayLoc[line[0]] = [float(line[1]), float(line[2])]
-    
-    # 지하철역 간 연결 정보 로드 (노드 집합 구성)
-    with open(SUBWAY_CSV, 'r', encoding='utf-8-sig') as f:
-        rdr = csv.reader(f)
-        for line in rdr:
-            temp1 = line[0]
-            temp2 = line[1]
-            nodes.add(temp1)
-            nodes.add(temp2)
-    
-    # Dijkstra 그래프 구성 (weight = 시간(분))
-    d = Dijkstra(nodes)
-    with open(SUBWAY_CSV, 'r', encoding='utf-8-sig') as f:
-        rdr = csv.reader(f)
-        for line in rdr:
-            n1, n2 = line[0], line[1]
-            dist_km = float(line[2])  # 3번째 컬럼이 거리(km)라고 가정
-
-            # 거리(km) -> 시간(분) 환산
-            time_min = dist_km * 60.0 / AVG_SPEED_KMH
-
-            edge_distance[(n1, n2)] = dist_km
-            edge_distance[(n2, n1)] = dist_km
-            edge_time[(n1, n2)] = time_min
-            edge_time[(n2, n1)] = time_min
-
-            d.setEdge(n1, n2, time_min)
-    
-    return subwayLoc, nodes, d, edge_distance, edge_time
+
+@st.cache_resource
+def load_time_matrix():
+    """모든 역 쌍의 소요 시간/next-hop 행렬 (memmap, 모든 세션이 공유)"""
+    _, _, graph, _, _ = load_subway_data()
+    key = source_hash(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+    return load_or_build_time_matrix(TIME_MATRIX, graph, key)
+
+
+@st.cache_resource
+def load_landmark_index():
+    """ALT 탐색용 랜드마크 거리 인덱스 (모든 세션이 공유)"""
+    _, _, graph, _, _ = load_subway_data()
+    key = source_hash(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+    return load_or_build_landmarks(LANDMARKS, graph, key)
+
+
+@st.cache_resource
+def load_contraction_hierarchy():
+    """Contraction Hierarchy 인덱스 (불변, 모든 세션이 공유 / 쿼리 상태는 CHDijkstra로 생성)"""
+    _, _, graph, _, _ = load_subway_data()
+    return ContractionHierarchy(graph)
+
+
+@st.cache_resource
+def load_hub_labels():
+    """2-hop 허브 라벨 거리 오라클 (불변, 모든 세션이 공유 / 허브 순서는 캐시된 CH의 rank에서)"""
+    _, _, graph, _, _ = load_subway_data()
+    return HubLabels(graph, order=order_from_rank(load_contraction_hierarchy().rank))
+
+
+@st.cache_resource
+def load_geocode_cache():
+    """
+    장소 검색 결과 SQLite 캐시 (모든 세션이 공유, 같은 파일을 쓰는 다른 프로세스와도 공유)
+    DB 파일을 열 수 없으면(읽기 전용 배포 환경 등) None -> 캐시 없이 매번 API 호출
+    """
+    try:
+        return GeocodeCache(
+            GEOCODE_CACHE_DB,
+            ttl_s=GEOCODE_CACHE_TTL_DAYS * 86400,
+            max_entries=GEOCODE_CACHE_MAX_ENTRIES,
+        )
+    except sqlite3.Error:
+        return None
+
+
+@st.cache_resource
+def load_station_autocomplete():
+    """역 이름 자동완성 트라이 (초성/낱자 접두어, 모든 세션이 공유)"""
+    _, _, graph, _, _ = load_subway_data()
+    return StationAutocomplete(graph.names)
+
+
+@st.cache_resource
+def load_raptor_engine():
+    """호선별 배차 간격 시간표 위의 RAPTOR 엔진 (불변, 모든 세션이 공유)"""
+    _, _, graph, _, _ = load_subway_data()
+    return RaptorEngine(graph, load_line_schedule(LINE_SCHEDULE_CSV))
+
+
+@st.cache_resource
+def load_tree_cache():
+    """출발역별 최단 경로 트리(LRU) 캐시 - 모든 세션이 공유 (시간 기준은 행렬 조회)"""
+    _, _, graph, _, _ = load_subway_data()
+    return TreeCache(graph, maxsize=TREE_CACHE_SIZE, matrix=load_time_matrix())
 
 
 # =========================
@@ -278,7 +254,17 @@ def kakao_keyword_search(query):
     """
     '인하대병원', '서울역' 같은 키워드를 카카오 로컬 API로 검색해서
     첫 번째 결과의 (lat, lng, place_name)을 반환
+    (같은 검색어는 장소 검색 캐시에서 API 호출 없이 반환)
     """
+    cache = load_geocode_cache()
+    if cache is not None:
+        try:
+            cached = cache.get(query)
+        except sqlite3.Error:
+            cached = None  # 잠금 대기 초과 등은 캐시 실패로 보고 API 호출
+        if cached is not None:
+            return cached
+
     if not KAKAO_REST_API_KEY:
         st.error("카카오 REST API 키가 설정되어 있지 않습니다.")
         return None
@@ -303,47 +289,155 @@ def kakao_keyword_search(query):
     lat = float(first["y"])
     lng = float(first["x"])
     place_name = first["place_name"]
+    if cache is not None:
+        try:
+            cache.put(query, lat, lng, place_name)
+        except sqlite3.Error:
+            pass  # 저장하지 못해도 검색 결과는 그대로 사용
     return lat, lng, place_name
 
 
-def find_nearest_station(subwayLoc, user_lat, user_lng):
+def show_geocode_cache_stats():
+    """장소 검색 캐시의 누적 적중/조회 횟수 표시 (모든 세션·프로세스 합계, 캐시를 못 쓰면 생략)"""
+    cache = load_geocode_cache()
+    if cache is None:
+        return
+    try:
+        stats = cache.stats()
+    except sqlite3.Error:
+        return
+    lookups = stats["hits"] + stats["misses"]
+    if lookups:
+        st.caption(
+            f"🗂️ 장소 검색 캐시: 적중 {stats['hits']}회 / 조회 {lookups}회 "
+            f"({stats['hits'] / lookups:.0%}) · 저장 {stats['entries']}건"
+        )
+
+
+def station_picker(label, key, autocomplete):
     """
-    사용자 위도/경도와 가장 가까운 지하철역(subwayLoc key)을 찾는다.
+    역 이름 입력창 + 자동완성 후보 선택 상자. 전체 역 목록 대신 입력에 맞는 상위 후보만
+    선택지로 보내며, 입력이 바뀌면 첫 번째 후보가 선택된다.
+    반환: 선택한 노드ID (st.session_state[key]에도 저장, 미선택이면 "")
     """
-    min_dist = float("inf")
-    nearest_name = None
-
-    for name, (lat, lng) in subwayLoc.items():
-        d = math.hypot(lat - user_lat, lng - user_lng)
-        if d < min_dist:
-            min_dist = d
-            nearest_name = name
+    query = st.text_input(
+        label, key=f"{key}_query", placeholder="역 이름 또는 초성 (예: 강남, 서울역, ㄱㄴ)"
+    )
+    matches = autocomplete.complete(query) if query else []
+    if query and not matches:
+        st.caption("일치하는 역이 없습니다.")
+    # 입력이 바뀌면 이전 선택을 지워서 첫 번째 후보가 선택되게 한다
+    if st.session_state.get(f"{key}_shown_query") != query:
+        st.session_state[f"{key}_shown_query"] = query
+        st.session_state.pop(key, None)
+    return st.selectbox(
+        f"{label} 후보", options=[""] + matches, index=1 if matches else 0,
+        key=key, label_visibility="collapsed"
+    )
+
+
+def parse_group_list(text):
+    """
+    명단 텍스트를 [(역 이름 또는 장소명, 가중치), ...]로 변환.
+    한 줄에 한 명, '이름, 가중치' 형식이면 가중치를 사용 (없으면 1.0), 빈 줄과 # 주석은 무시.
+    첫 줄이 머리글(예: "이름,가중치")이면 건너뛰고, 가중치가 숫자가 아니거나
+    MIN_WEIGHT ~ MAX_WEIGHT 범위 밖(음수, 0, nan, inf 포함)인 줄은 제외한다.
+    반환: (항목 목록, 제외한 줄 목록)
+    """
+    entries = []
+    rejected = []
+    first = True
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = [p.strip() for p in line.replace("\t", ",").split(",")]
+        weight = 1.0
+        if len(parts) > 1 and parts[1]:
+            try:
+                weight = float(parts[1])
+            except ValueError:
+                weight = None
+        is_first, first = first, False
+        if is_first and (weight is None or parts[0].lower() in GROUP_HEADER_NAMES):
+            continue  # 머리글 줄
+        if not parts[0] or weight is None or not math.isfinite(weight) \
+                or not MIN_WEIGHT <= weight <= MAX_WEIGHT:
+            rejected.append(line)
+            continue
+        entries.append((parts[0], weight))
+    return entries, rejected
 
-    return nearest_name
 
+def decode_group_file(data):
+    """업로드한 명단 파일 바이트 -> 문자열 (UTF-8, 안 되면 한글 엑셀 기본값인 CP949), 실패하면 None"""
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return None
 
-def normalize_station_name(name: str) -> str:
-    # 역 이름 비교용: 괄호 앞까지만, '역', 공백 제거
-    if not name:
-        return ""
-    # 예: "홍대입구(2)" -> "홍대입구"
-    base = name.split("(")[0]
-    base = base.replace("역", "").replace(" ", "").strip()
-    return base
 
-def find_station_id_by_name(station_name, nodes):
+def resolve_group_starts(entries, name_index, station_index):
     """
-    subwayLoc에서 온 station_name과 subway.csv의 노드ID(예: '홍대입구(2)')를
-    최대한 유연하게 매칭
+    명단 항목을 출발역 노드ID로 변환 (같은 이름은 한 번만 조회).
+      1) 역 이름 색인 (노드ID 그대로, 역 이름, 부역명) — 여러 호선이 있는 역은 모든 호선에서 출발
+      2) 카카오 장소 검색 후 주변 역 여러 곳
+    2)와 여러 호선 역은 항목 이름이 다중 출발 탐색의 출발지 키가 된다.
+    반환: (출발역/출발지 목록, 가중치 목록, 찾지 못한 항목 목록, {출발지: {노드ID: 도보 시간(분)}})
     """
-    target = normalize_station_name(station_name)
+    resolved = {}
+    origins = {}
+    start_ids, weights, unresolved = [], [], []
+    for query, weight in entries:
+        if query not in resolved:
+            station_id = None
+            found = name_index.lookup(query)
+            if len(found) == 1:
+                station_id = found[0]
+            elif found:
+                station_id = query
+                origins[query] = dict.fromkeys(found, 0.0)
+            elif KAKAO_REST_API_KEY:
+                result = kakao_keyword_search(query)
+                if result is not None:
+                    lat, lng, _ = result
+                    seeds = snap_to_stations(station_index, name_index, lat, lng)
+                    if seeds:
+                        station_id = query
+                        origins[query] = seeds
+            resolved[query] = station_id
+        if resolved[query] is None:
+            unresolved.append(query)
+            continue
+        start_ids.append(resolved[query])
+        weights.append(weight)
+    return start_ids, weights, unresolved, origins
+
+
+def split_path_lines(pathList):
+    """노드ID 경로를 (역 이름 목록, 호선 목록)으로 분리 (예: "원인재(B)" -> "원인재", "B")"""
+    pathNames = []
+    pathLine = []
+    for item in pathList:
+        if "(" in item:
+            pathNames.append(item.split("(")[0])
+            pathLine.append(item.split("(")[1].rstrip(")"))
+        else:
+            pathNames.append(item)
+            pathLine.append("")
+    return pathNames, pathLine
+
+
+# 도달 범위 지도 색상 (예산 대비 소요시간 구간별, 가까울수록 초록)
+ISOCHRONE_COLORS = ["#1a9850", "#91cf60", "#fee08b", "#fc8d59", "#d73027"]
 
-    for n in nodes:
-        node_base = normalize_station_name(n)
-        if node_base == target:
-            return n
-    return None
 
+def isochrone_color(minutes, budget):
+    """예산(budget) 대비 소요시간 구간에 해당하는 색상"""
+    band = min(int(minutes / budget * len(ISOCHRONE_COLORS)), len(ISOCHRONE_COLORS) - 1)
+    return ISOCHRONE_COLORS[band]
 
 
 def kakao_search_hotplaces(lat, lng, radius=1000, category_group_code="FD6"):
@@ -385,64 +479,6 @@ def kakao_search_hotplaces(lat, lng, radius=1000, category_group_code="FD6"):
     return results
 
 
-def compute_all_costs_from(start_station_id, nodes, dijkstra: Dijkstra):
-    """
-    한 출발역에서 모든 역까지의 최단 소요 시간을 계산해서 dict로 반환
-    """
-    dijkstra.reset()
-    _ = dijkstra.getPath(start_station_id, start_station_id)
-    return {node: dijkstra.cost[node][0] for node in nodes}
-
-
-def find_best_meeting_station(start_station_ids, nodes, dijkstra: Dijkstra):
-    """
-    여러 출발역(start_station_ids)에서 출발할 때
-    총 소요 시간이 최소가 되는 만남역을 찾는다.
-    """
-    all_costs = {}
-    for s in start_station_ids:
-        all_costs[s] = compute_all_costs_from(s, nodes, dijkstra)
-
-    best_station = None
-    best_total_time = float("inf")
-
-    for candidate in nodes:
-        total_time = 0
-        unreachable = False
-        for s in start_station_ids:
-            t = all_costs[s].get(candidate, float("inf"))
-            if t == float("inf"):
-                unreachable = True
-                break
-            total_time += t
-        
-        if unreachable:
-            continue
-
-        if total_time < best_total_time:
-            best_total_time = total_time
-            best_station = candidate
-
-    return best_station, best_total_time, all_costs
-
-
-def get_path_distance_and_time(pathList, edge_distance, edge_time):
-    """
-    pathList(노드ID 리스트)에 대해
-    총 거리(km)와 총 시간(분)을 계산
-    """
-    total_dist = 0.0
-    total_time = 0.0
-    for i in range(len(pathList) - 1):
-        a = pathList[i]
-        b = pathList[i+1]
-        d = edge_distance.get((a, b), 0.0)
-        t = edge_time.get((a, b), 0.0)
-        total_dist += d
-        total_time += t
-    return total_dist, total_time
-
-
 # =========================
 # 메인 앱 로직
 # =========================
@@ -457,8 +493,10 @@ st.markdown("""
 
 # 데이터 로드
 with st.spinner("지하철 데이터를 불러오는 중..."):
-    subwayLoc, nodes, dijkstra, edge_distance, edge_time = load_subway_data()
-    station_list = sorted(list(nodes))
+    subwayLoc, nodes, graph, station_index, name_index = load_subway_data()
+    tree_cache = load_tree_cache()
+    time_matrix = tree_cache.matrix
+    station_autocomplete = load_station_autocomplete()
 
 st.markdown("<br>", unsafe_allow_html=True)
 
@@ -468,7 +506,7 @@ col1, col2 = st.columns([1, 1.5], gap="large")
 # 왼쪽: 컨트롤/입력
 # -------------------------
 with col1:
-    tab1, tab2 = st.tabs(["단일 경로 찾기", "다중 인원 만남 지점"])
+    tab1, tab2, tab3 = st.tabs(["단일 경로 찾기", "다중 인원 만남 지점", "도달 범위"])
 
     # -------------------------
     # 탭 1: 단일 경로 (기본 기능)
@@ -477,18 +515,19 @@ with col1:
         st.markdown("### 🎯 단일 출발-도착 최단경로")
         st.markdown("출발역과 도착역을 선택하여 최단 경로를 찾아보세요.")
 
-        start_station = st.selectbox(
-            "📍 출발역",
-            options=[""] + station_list,
-            index=0,
-            key="single_start"
-        )
+        start_station = station_picker("📍 출발역", "single_start", station_autocomplete)
+        destination_station = station_picker("🎯 도착역", "single_destination", station_autocomplete)
 
-        destination_station = st.selectbox(
-            "🎯 도착역",
-            options=[""] + station_list,
+        search_mode = st.radio(
+            "🧭 탐색 방식",
+            ["Dijkstra", "양방향 Dijkstra", "A* (직선거리 휴리스틱)", "ALT (랜드마크 휴리스틱)",
+             "Contraction Hierarchy", "허브 라벨 (거리 오라클)", "사전 계산 행렬 (즉시 조회)"],
             index=0,
-            key="single_destination"
+            horizontal=True,
+            key="single_search_mode",
+            help="모든 방식의 소요 시간은 같습니다. 다만 소요 시간이 같은 경로가 여럿이면 "
+                 "방식마다 다른 경로를 보여줄 수 있습니다 (특히 양방향 Dijkstra는 "
+                 "두 탐색이 만난 지점을 기준으로 경로를 고릅니다)."
         )
 
         st.markdown("<br>", unsafe_allow_html=True)
@@ -503,26 +542,33 @@ with col1:
             elif start_station == destination_station:
                 st.warning("출발역과 도착역이 같습니다.")
             else:
-                dijkstra.reset()
-                pathList = dijkstra.getPath(start_station, destination_station)
+                dijkstra = Dijkstra(graph)
+                if search_mode.startswith("사전 계산 행렬"):
+                    # 탐색 없이 next-hop 행렬을 따라 경로 복원
+                    pathList = time_matrix.pathTo(start_station, destination_station)
+                elif search_mode.startswith("허브 라벨"):
+                    # 두 역의 정렬된 라벨을 병합해 공통 허브를 찾고, 라벨의 parent로 경로 복원
+                    pathList = load_hub_labels().pathTo(start_station, destination_station)
+                elif search_mode == "Contraction Hierarchy":
+                    # 전처리된 계층에서 rank가 높아지는 방향으로만 양방향 탐색
+                    dijkstra = CHDijkstra(load_contraction_hierarchy())
+                    pathList = dijkstra.getPath(start_station, destination_station)
+                elif search_mode.startswith("ALT"):
+                    pathList = dijkstra.getPath(
+                        start_station, destination_station, landmarks=load_landmark_index()
+                    )
+                elif search_mode == "양방향 Dijkstra":
+                    pathList = dijkstra.getPathBidirectional(start_station, destination_station)
+                else:
+                    pathList = dijkstra.getPath(
+                        start_station, destination_station,
+                        astar=search_mode.startswith("A*")
+                    )
 
                 if pathList:
-                    pathNames = []
-                    pathLine = []
-                    for item in pathList:
-                        # 괄호 앞까지만 역 이름 추출 (예: "원인재(B)" -> "원인재", "원인재(I1)" -> "원인재")
-                        if "(" in item:
-                            station_name = item.split("(")[0]
-                            line_part = item.split("(")[1].rstrip(")")
-                            # 호선 번호만 추출 (예: "I1" -> "I1", "B" -> "B")
-                            line_num = line_part
-                        else:
-                            station_name = item
-                            line_num = ""
-                        pathNames.append(station_name)
-                        pathLine.append(line_num)
+                    pathNames, pathLine = split_path_lines(pathList)
 
-                    total_dist, total_time = get_path_distance_and_time(pathList, edge_distance, edge_time)
+                    total_dist, total_time = get_path_distance_and_time(pathList, graph)
 
                     st.success(f"✅ 경로를 찾았습니다! (총 {len(pathList)}개 역 경유)")
                     st.markdown("---")
@@ -532,6 +578,16 @@ with col1:
                         [f"{name}({line})" for name, line in zip(pathNames, pathLine)]
                     )
                     st.markdown(f'<div class="path-card">{path_text}</div>', unsafe_allow_html=True)
+                    if search_mode.startswith("사전 계산 행렬"):
+                        st.caption("탐색 없이 사전 계산 행렬에서 조회했습니다.")
+                    elif search_mode.startswith("허브 라벨"):
+                        label_sizes = load_hub_labels().labelSizes()
+                        st.caption(
+                            f"탐색 없이 허브 라벨 {label_sizes[start_station]} + "
+                            f"{label_sizes[destination_station]}개를 비교했습니다."
+                        )
+                    else:
+                        st.caption(f"탐색한 역 수: {dijkstra.settled} / {len(nodes)}")
 
                     col_info1, col_info2 = st.columns(2)
                     with col_info1:
@@ -546,6 +602,139 @@ with col1:
                 else:
                     st.error("경로를 찾을 수 없습니다.")
 
+        # 장소 -> 장소 경로 (출발/도착 주변 역 여러 곳을 도보 시간과 함께 한 번에 탐색)
+        with st.expander("📍 장소로 경로 찾기 (주변 역 여러 곳 비교)"):
+            place_from = st.text_input("출발 장소", key="single_place_from", placeholder="예: 인하대병원")
+            place_to = st.text_input("도착 장소", key="single_place_to", placeholder="예: 코엑스")
+            if st.button("🔍 장소로 찾기", use_container_width=True, key="single_place_btn"):
+                if not place_from or not place_to:
+                    st.error("출발 장소와 도착 장소를 모두 입력해주세요.")
+                else:
+                    with st.spinner("검색 중..."):
+                        found_from = kakao_keyword_search(place_from)
+                        found_to = kakao_keyword_search(place_to) if found_from else None
+                    if found_from and found_to:
+                        sources = snap_to_stations(station_index, name_index, found_from[0], found_from[1])
+                        destinations = snap_to_stations(station_index, name_index, found_to[0], found_to[1])
+                        dijkstra = Dijkstra(graph)
+                        pathList = dijkstra.getPathMulti(sources, destinations)
+                        if not pathList:
+                            st.error("경로를 찾을 수 없습니다.")
+                        else:
+                            walk_in = sources[pathList[0]]
+                            walk_out = destinations[pathList[-1]]
+                            total_dist, ride_time = get_path_distance_and_time(pathList, graph)
+                            pathNames, pathLine = split_path_lines(pathList)
+                            path_text = " → ".join(f"{name}({line})" for name, line in zip(pathNames, pathLine))
+                            st.markdown(f"🚶 {found_from[2]} → {pathList[0]} 도보 {walk_in:.0f}분")
+                            st.markdown(f'<div class="path-card">{path_text}</div>', unsafe_allow_html=True)
+                            st.markdown(f"🚶 {pathList[-1]} → {found_to[2]} 도보 {walk_out:.0f}분")
+                            st.caption(
+                                f"출발 후보 {len(sources)}개 · 도착 후보 {len(destinations)}개 역을 "
+                                f"한 번의 탐색으로 비교 (탐색한 역 수: {dijkstra.settled} / {len(nodes)})"
+                            )
+                            st.metric("⏱️ 도보 포함 예상 소요 시간", f"{walk_in + ride_time + walk_out:.1f} 분",
+                                      delta=f"지하철 {ride_time:.1f}분 · {total_dist:.2f} km", delta_color="off")
+
+                            st.session_state["mode"] = "single"
+                            st.session_state["single_pathList"] = pathList
+                            st.session_state["single_pathNames"] = pathNames
+                            st.session_state["single_pathLine"] = pathLine
+            show_geocode_cache_stats()
+
+        # 환승 횟수 vs 소요 시간 파레토 경로 비교
+        st.markdown("---")
+        st.markdown("#### 🔁 환승 적은 경로 비교")
+        if st.button("환승 횟수별 경로 찾기", use_container_width=True, key="single_pareto_btn"):
+            if not start_station or not destination_station or start_station == destination_station:
+                st.error("서로 다른 출발역과 도착역을 선택해주세요.")
+            else:
+                front = pareto_routes(graph, start_station, destination_station)
+                if not front:
+                    st.error("경로를 찾을 수 없습니다.")
+                st.session_state["single_front"] = {
+                    "start": start_station, "end": destination_station, "routes": front
+                }
+                st.session_state["single_front_shown"] = None
+
+        # 현재 선택한 출발/도착역의 결과만 표시
+        front_state = st.session_state.get("single_front") or {}
+        front = None
+        if (front_state.get("start"), front_state.get("end")) == (start_station, destination_station):
+            front = front_state["routes"]
+        if front:
+            front_labels = []
+            for i, route in enumerate(front):
+                tag = "⚡ 가장 빠른 경로" if i == 0 else ("🔁 환승 최소" if i == len(front) - 1 else "⚖️ 절충")
+                front_labels.append(f"{tag}: {route['time']:.1f}분 · 환승 {route['transfers']}회")
+            chosen_label = st.radio("경로 선택", front_labels, index=0, key="single_front_choice")
+            route = front[front_labels.index(chosen_label)]
+
+            pathNames, pathLine = split_path_lines(route["path"])
+            path_text = " → ".join(f"{name}({line})" for name, line in zip(pathNames, pathLine))
+            st.markdown(f'<div class="path-card">{path_text}</div>', unsafe_allow_html=True)
+            st.caption(f"총 거리 {route['distance']:.2f} km · 예상 소요 시간 {route['time']:.1f}분")
+
+            # 새로 찾았거나 선택을 바꿨을 때만 지도 표시 대상을 바꾼다 (다른 탭 결과를 덮지 않도록)
+            if st.session_state.get("single_front_shown") != chosen_label:
+                st.session_state["single_front_shown"] = chosen_label
+                st.session_state["mode"] = "single"
+                st.session_state["single_pathList"] = route["path"]
+                st.session_state["single_pathNames"] = pathNames
+                st.session_state["single_pathLine"] = pathLine
+
+        # 출발 시각 기준 경로 (배차 간격/대기 시간 반영, RAPTOR)
+        st.markdown("---")
+        st.markdown("#### 🕒 출발 시각 기준 경로")
+        depart_time = st.time_input("출발 시각", value=datetime.time(8, 0), step=300, key="single_depart_time")
+        if st.button("시간표로 경로 찾기", use_container_width=True, key="single_raptor_btn"):
+            if not start_station or not destination_station or start_station == destination_station:
+                st.error("서로 다른 출발역과 도착역을 선택해주세요.")
+            else:
+                depart_min = depart_time.hour * 60 + depart_time.minute
+                journeys = load_raptor_engine().query(start_station, destination_station, depart_min)
+                if not journeys:
+                    st.error("이 시각에 출발해 도착할 수 있는 열차가 없습니다.")
+                st.session_state["single_journeys"] = {
+                    "start": start_station, "end": destination_station, "journeys": journeys
+                }
+                st.session_state["single_journey_shown"] = None
+
+        journey_state = st.session_state.get("single_journeys") or {}
+        journeys = None
+        if (journey_state.get("start"), journey_state.get("end")) == (start_station, destination_station):
+            journeys = journey_state["journeys"]
+        if journeys:
+            # 탑승 횟수가 적은 여정부터 (뒤로 갈수록 탑승은 늘고 도착은 빨라짐)
+            # 환승 횟수는 경로 선택과 같은 기준 (환승 통로 이동 횟수)
+            journey_labels = [
+                f"{format_clock(j['arrival'])} 도착 ({j['duration']:.0f}분) · "
+                f"탑승 {j['rides']}회 · 환승 {j['transfers']}회"
+                for j in journeys
+            ]
+            chosen_label = st.radio("여정 선택", journey_labels, index=len(journeys) - 1,
+                                    key="single_journey_choice")
+            journey = journeys[journey_labels.index(chosen_label)]
+
+            for leg in journey["legs"]:
+                if leg["type"] == "ride":
+                    st.markdown(
+                        f"🚇 {leg['from']} {format_clock(leg['depart'])} → "
+                        f"{leg['to']} {format_clock(leg['arrive'])} ({len(leg['stops']) - 1}개 역)"
+                    )
+                else:
+                    st.markdown(f"🚶 환승 {leg['from']} → {leg['to']}")
+            st.caption(f"{format_clock(journey['depart'])} 출발 기준, 열차 대기 시간과 환승 이동 "
+                       f"{load_raptor_engine().transfer_min:.0f}분 포함")
+
+            if st.session_state.get("single_journey_shown") != chosen_label:
+                st.session_state["single_journey_shown"] = chosen_label
+                pathNames, pathLine = split_path_lines(journey["path"])
+                st.session_state["mode"] = "single"
+                st.session_state["single_pathList"] = journey["path"]
+                st.session_state["single_pathNames"] = pathNames
+                st.session_state["single_pathLine"] = pathLine
+
     # -------------------------
     # 탭 2: 다중 인원 최적 만남 지점
     # -------------------------
@@ -553,42 +742,65 @@ with col1:
         st.markdown("### 👥 다중 인원 최적 만남 지점 찾기")
         st.markdown("여러 사람이 만나기 가장 좋은 지하철역을 찾아드립니다.")
 
-        # 세션 상태에 인원 수 저장 (초기값 설정)
-        if "num_people" not in st.session_state:
-            st.session_state["num_people"] = 3
-        
-        num_people = st.number_input(
-            "👤 인원 수 선택",
-            min_value=2,
-            max_value=5,
-            value=st.session_state["num_people"],
-            step=1,
-            key="num_people",
-            help="2명부터 5명까지 선택 가능합니다."
-        )
-
         location_mode = st.radio(
             "📍 출발 위치 입력 방식",
-            ["직접 역 선택", "장소 검색(예: 인하대병원)"],
+            ["직접 역 선택", "장소 검색(예: 인하대병원)", "명단 입력(대규모 모임)"],
             index=1,
             horizontal=True
         )
+        group_mode = location_mode == "명단 입력(대규모 모임)"
 
-        start_station_ids = []
+        # 세션 상태에 인원 수 저장 (초기값 설정)
+        if "num_people" not in st.session_state:
+            st.session_state["num_people"] = 3
+
+        num_people = 0
+        if group_mode:
+            # 사람별 입력창 대신 명단 한 번에 입력 (수십~수백 명)
+            group_text = st.text_area(
+                "📋 참석자 출발지 명단",
+                key="group_text",
+                height=200,
+                placeholder="한 줄에 한 명씩 역 이름 또는 장소명을 입력하세요.\n예: 서울역\n잠실(2)\n인하대병원, 2  (쉼표 뒤 숫자는 가중치)",
+            )
+            group_file = st.file_uploader(
+                "또는 명단 파일 업로드 (.txt, .csv)", type=["txt", "csv"], key="group_file"
+            )
+            group_entries, rejected_lines = parse_group_list(group_text)
+            if group_file is not None:
+                file_text = decode_group_file(group_file.getvalue())
+                if file_text is None:
+                    st.error("명단 파일을 읽지 못했습니다. UTF-8 또는 CP949(한글 엑셀) 형식으로 저장해주세요.")
+                else:
+                    file_entries, file_rejected = parse_group_list(file_text)
+                    group_entries = file_entries + group_entries
+                    rejected_lines = file_rejected + rejected_lines
+            if rejected_lines:
+                st.warning(
+                    f"⚠️ 가중치가 잘못되어 제외한 줄 {len(rejected_lines)}개 "
+                    f"({MIN_WEIGHT:g}~{MAX_WEIGHT:g} 사이 숫자만 가능): {', '.join(rejected_lines[:10])}"
+                )
+            st.caption(f"명단 {len(group_entries)}명 (최대 {MAX_GROUP_SIZE}명)")
+        else:
+            num_people = st.number_input(
+                "👤 인원 수 선택",
+                min_value=2,
+                max_value=MAX_PEOPLE,
+                value=st.session_state["num_people"],
+                step=1,
+                key="num_people",
+                help=f"2명부터 {MAX_PEOPLE}명까지 선택 가능합니다. 더 많은 인원은 명단 입력을 사용하세요."
+            )
 
         start_station_ids = []
+        start_origins = {}  # 장소 검색 출발지 -> {주변 역 노드ID: 도보 시간(분)}
 
         for i in range(num_people):
             st.markdown(f"#### 👤 {i+1}번 사람 출발지")
             with st.container():
                 if location_mode == "직접 역 선택":
                     # key를 person_{i}_station으로 통일 (검색 모드와 동일한 세션키)
-                    st.selectbox(
-                        f"{i+1}번 사람 출발역",
-                        options=[""] + station_list,
-                        key=f"person_{i}_station",
-                        label_visibility="visible"
-                    )
+                    station_picker(f"{i+1}번 사람 출발역", f"person_{i}_station", station_autocomplete)
                     # 즉시 append하지 않고 아래에서 session_state로 한 번만 읽습니다.
 
                 elif location_mode == "장소 검색(예: 인하대병원)":
@@ -611,6 +823,8 @@ with col1:
                         result_info = st.session_state[f"person_{i}_search_result"]
                         st.success(f"✅ '{result_info['place_name']}' 위치를 사용합니다.")
                         st.info(f"🚇 가장 가까운 지하철역: **{result_info['nearest_name']}**")
+                        if result_info.get("nearby"):
+                            st.caption(f"주변 역: {result_info['nearby']}")
                     
                     if search_clicked:
                         if not query:
@@ -621,94 +835,190 @@ with col1:
                             if result is not None:
                                 lat, lng, place_name = result
                                 
-                                nearest_name = find_nearest_station(subwayLoc, lat, lng)
-                                station_id = find_station_id_by_name(nearest_name, nodes)
+                                nearby = station_index.nearest(lat, lng, k=SNAP_K)
+                                nearest_name = nearby[0][0] if nearby else None
+                                station_id = name_index.resolve(nearest_name) if nearest_name else None
+                                nearby_text = ", ".join(
+                                    f"{name} {km * 1000:.0f} m(도보 {walk_minutes(km):.0f}분)"
+                                    for name, km in nearby
+                                )
                                 if station_id:
                                     st.session_state[f"person_{i}_station"] = station_id
+                                    # 주변 역 여러 곳을 도보 시간과 함께 출발 후보로 (만남역 탐색 시 한 번에 탐색)
                                     st.session_state[f"person_{i}_search_result"] = {
                                         "place_name": place_name,
-                                        "nearest_name": nearest_name
+                                        "nearest_name": nearest_name,
+                                        "nearby": nearby_text,
+                                        "origin_key": f"{place_name} 주변",
+                                        "seeds": snap_to_stations(station_index, name_index, lat, lng)
                                     }
                                     st.success(f"✅ '{place_name}' 위치를 사용합니다.")
                                     st.info(f"🚇 가장 가까운 지하철역: **{nearest_name}**")
+                                    st.caption(f"주변 역: {nearby_text}")
                                 else:
                                     st.error("❌ 해당 역 이름에 해당하는 노드를 찾지 못했습니다.")
                                     st.session_state[f"person_{i}_search_result"] = None
 
                 # 루프 밖에서 한 번만 세션에서 읽어 append
                 station_id = st.session_state.get(f"person_{i}_station", "")
+                search_result = st.session_state.get(f"person_{i}_search_result")
+                if location_mode != "직접 역 선택" and search_result and search_result.get("seeds"):
+                    # 장소 검색: 주변 역 여러 곳에서 동시에 출발하는 가상 출발지
+                    station_id = search_result["origin_key"]
+                    start_origins[station_id] = search_result["seeds"]
                 start_station_ids.append(station_id)
             st.markdown("<br>", unsafe_allow_html=True)
 # ...existing code...
 
+        if location_mode != "직접 역 선택":
+            show_geocode_cache_stats()
+
         st.markdown("<br>", unsafe_allow_html=True)
+        objective_labels = list(OBJECTIVES.values())
+        objective_label = st.radio(
+            "⚖️ 만남역 선정 기준",
+            objective_labels,
+            index=0,
+            key="meeting_objective",
+            help="기준을 바꾸면 이미 계산한 소요시간으로 즉시 다시 선정합니다."
+        )
+        objective = list(OBJECTIVES)[objective_labels.index(objective_label)]
+        top_k = st.slider(
+            "🏅 후보 만남역 개수", min_value=1, max_value=10, value=5, key="meeting_top_k",
+            help="같은 역의 다른 호선(예: 잠실(2), 잠실(8))은 하나의 후보로 합칩니다."
+        )
+
+        lam = DEFAULT_LAMBDA
+        if objective == "sum_std":
+            lam = st.slider(
+                "λ (공평성 가중치)", min_value=0.0, max_value=5.0,
+                value=DEFAULT_LAMBDA, step=0.1, key="meeting_lambda"
+            )
+        elif objective == "weighted" and group_mode:
+            st.caption("가중치는 명단의 '이름, 가중치' 값을 사용합니다.")
+        elif objective == "weighted":
+            for i in range(num_people):
+                st.number_input(
+                    f"{i+1}번 사람 가중치", min_value=MIN_WEIGHT, max_value=MAX_WEIGHT,
+                    value=1.0, step=0.1, key=f"person_{i}_weight"
+                )
+
         if st.button(
             "🎯 최적 만남역 찾기",
             type="primary", use_container_width=True,
             key="meeting_btn"
         ):
-            if any(not s for s in start_station_ids):
+            group_weights = None
+            input_ok = True
+            if group_mode and len(group_entries) > MAX_GROUP_SIZE:
+                # 항목마다 장소 검색(API 호출)이 일어날 수 있으므로 변환 전에 인원 수부터 확인
+                st.error(f"명단은 최대 {MAX_GROUP_SIZE}명까지 입력할 수 있습니다.")
+                input_ok = False
+            elif group_mode:
+                with st.spinner("명단의 출발역을 찾는 중..."):
+                    start_station_ids, group_weights, unresolved, start_origins = resolve_group_starts(
+                        group_entries, name_index, station_index
+                    )
+                if unresolved:
+                    st.warning(f"⚠️ 출발역을 찾지 못해 제외한 항목 {len(unresolved)}개: {', '.join(list(dict.fromkeys(unresolved))[:10])}")
+                if len(start_station_ids) < 2:
+                    st.error("명단에서 출발역을 2명 이상 찾아야 합니다.")
+                    input_ok = False
+            elif any(not s for s in start_station_ids):
                 st.error("모든 사람의 출발역(또는 검색 결과)을 설정해주세요.")
+                input_ok = False
+
+            if input_ok:
+                # 출발역별 최단 경로 트리를 고유 출발역마다 한 번만 계산해 세션에 보관 (기준 변경 시 재사용)
+                _, _, all_costs, _ = find_best_meeting_station(
+                    start_station_ids, tree_cache, origins=start_origins
+                )
+                st.session_state["mode"] = "meeting"
+                st.session_state["meeting_start_ids"] = list(start_station_ids)
+                st.session_state["meeting_all_costs"] = all_costs
+                st.session_state["meeting_group_weights"] = group_weights
+
+        if st.session_state.get("mode") == "meeting" and "meeting_all_costs" in st.session_state:
+            meeting_start_ids = st.session_state["meeting_start_ids"]
+            all_costs = st.session_state["meeting_all_costs"]
+            group_weights = st.session_state.get("meeting_group_weights")
+            weights = None
+            if objective == "weighted" and group_weights is not None:
+                weights = group_weights
+            elif objective == "weighted":
+                weights = [
+                    st.session_state.get(f"person_{i}_weight", 1.0)
+                    for i in range(len(meeting_start_ids))
+                ]
+
+            _, _, scores = best_meeting_station(
+                all_costs, meeting_start_ids, graph.names, objective, lam, weights
+            )
+            candidates = top_k_meeting_stations(scores, graph, k=top_k)
+            if not candidates:
+                st.error("❌ 모든 사람이 도달 가능한 공통 역을 찾지 못했습니다.")
             else:
-                best_station, best_total_time, all_costs = find_best_meeting_station(
-                    start_station_ids, nodes, dijkstra
+                # 후보 중 하나를 골라 지도/경로에 표시 (경로는 이미 계산된 트리에서 복원)
+                candidate_labels = [
+                    f"{rank}. {c['name']} (점수 {c['score']:.1f})"
+                    for rank, c in enumerate(candidates, start=1)
+                ]
+                chosen_label = st.radio(
+                    "🏅 후보 만남역 순위", candidate_labels, index=0, key="meeting_candidate"
                 )
-                if best_station is None:
-                    st.error("❌ 모든 사람이 도달 가능한 공통 역을 찾지 못했습니다.")
-                else:
-                    # 괄호 앞까지만 역 이름 추출
-                    if "(" in best_station:
-                        best_station_name = best_station.split("(")[0]
-                    else:
-                        best_station_name = best_station
-                    st.markdown("---")
-                    st.markdown(f"""
-                    <div class="info-card">
-                        <h2 style="color: white; margin: 0 ;">⭐ 최적 만남역</h2>
-                        <h1 style="color: white; margin: 0.5rem 0;">{best_station_name}</h1>
-                        <p style="color: white; font-size: 1.1rem; margin: 0;">총 예상 소요시간 합계: <strong>{best_total_time:.1f}분</strong></p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                chosen_rank = candidate_labels.index(chosen_label) + 1
+                chosen = candidates[chosen_rank - 1]
+                card_title = "⭐ 최적 만남역" if chosen_rank == 1 else f"⭐ {chosen_rank}순위 후보 만남역"
+                best_station = chosen["station"]
+                best_station_name = chosen["name"]
+                best_score = chosen["score"]
+                person_times = [all_costs[s].costTo(best_station) for s in meeting_start_ids]
+                st.markdown("---")
+                st.markdown(f"""
+                <div class="info-card">
+                    <h2 style="color: white; margin: 0 ;">{card_title}</h2>
+                    <h1 style="color: white; margin: 0.5rem 0;">{best_station_name}</h1>
+                    <p style="color: white; font-size: 1.1rem; margin: 0;">기준: {objective_label} (점수 <strong>{best_score:.1f}</strong>)</p>
+                    <p style="color: white; font-size: 1.1rem; margin: 0;">총 예상 소요시간 합계: <strong>{sum(person_times):.1f}분</strong> · 최대 <strong>{max(person_times):.1f}분</strong></p>
+                </div>
+                """, unsafe_allow_html=True)
 
-                    # 각 사람별 경로 복원 및 시간 계산
-                    meeting_paths = []
-                    for idx, s in enumerate(start_station_ids):
-                        dijkstra.reset()
-                        p = dijkstra.getPath(s, best_station)
-                        if not p:
-                            continue
-
-                        pathNames = []
-                        pathLine = []
-                        for item in p:
-                            # 괄호 앞까지만 역 이름 추출 (예: "원인재(B)" -> "원인재", "원인재(I1)" -> "원인재")
-                            if "(" in item:
-                                station_name = item.split("(")[0]
-                                line_part = item.split("(")[1].rstrip(")")
-                                # 호선 번호만 추출 (예: "I1" -> "I1", "B" -> "B")
-                                line_num = line_part
-                            else:
-                                station_name = item
-                                line_num = ""
-                            pathNames.append(station_name)
-                            pathLine.append(line_num)
-
-                        # 시간은 all_costs에서 직접 사용 (가장 정확)
-                        t = all_costs[s][best_station]
-                        # 거리는 대략 계산 (필요 없으면 제거 가능)
-                        dist, _ = get_path_distance_and_time(p, edge_distance, edge_time)
-
-                        meeting_paths.append({
-                            "person_idx": idx + 1,
-                            "start_station": s,
-                            "pathList": p,
-                            "pathNames": pathNames,
-                            "pathLine": pathLine,
-                            "total_dist": dist,
-                            "total_time": t
-                        })
-
-                    # 만남역 주변 핫플 검색 (지도 아래 표시용, 여기서는 표시하지 않음)
+                # 각 사람별 경로 복원 및 시간 계산 (명단 입력은 같은 출발역끼리 묶어 표시)
+                if group_weights is not None:
+                    group_starts, group_counts, _ = group_start_stations(meeting_start_ids)
+                    path_sources = [
+                        (f"{s} 출발 {int(c)}명", s) for s, c in zip(group_starts, group_counts)
+                    ]
+                else:
+                    path_sources = [(f"{idx + 1}번 사람", s) for idx, s in enumerate(meeting_start_ids)]
+
+                meeting_paths = []
+                for idx, (label, s) in enumerate(path_sources):
+                    # 만남역 탐색 때 만든 최단 경로 트리의 부모 배열로 경로 복원 (재탐색 없음)
+                    p = all_costs[s].pathTo(best_station)
+                    if not p:
+                        continue
+
+                    pathNames, pathLine = split_path_lines(p)
+
+                    # 시간은 all_costs에서 직접 사용 (가장 정확)
+                    t = all_costs[s].costTo(best_station)
+                    # 거리는 대략 계산 (필요 없으면 제거 가능)
+                    dist, _ = get_path_distance_and_time(p, graph)
+
+                    meeting_paths.append({
+                        "person_idx": idx + 1,
+                        "label": label,
+                        "start_station": s,
+                        "pathList": p,
+                        "pathNames": pathNames,
+                        "pathLine": pathLine,
+                        "total_dist": dist,
+                        "total_time": t
+                    })
+
+                # 만남역 주변 핫플 검색 (만남역이 바뀐 경우에만 다시 검색)
+                if st.session_state.get("meeting_station") != best_station:
                     center_lat, center_lng = subwayLoc.get(best_station_name, (None, None))
                     hotplaces = []
                     if center_lat is not None:
@@ -716,14 +1026,62 @@ with col1:
                             hotplaces = kakao_search_hotplaces(
                                 center_lat, center_lng, radius=1000, category_group_code="FD6"
                             )
-
-                    # 세션 상태 저장 (지도 표시용)
-                    st.session_state["mode"] = "meeting"
-                    st.session_state["meeting_station"] = best_station
-                    st.session_state["meeting_station_name"] = best_station_name
-                    st.session_state["meeting_paths"] = meeting_paths
                     st.session_state["meeting_hotplaces"] = hotplaces
 
+                # 세션 상태 저장 (지도 표시용)
+                st.session_state["meeting_station"] = best_station
+                st.session_state["meeting_station_name"] = best_station_name
+                st.session_state["meeting_paths"] = meeting_paths
+
+    # -------------------------
+    # 탭 3: 도달 범위 (T분 안에 갈 수 있는 역)
+    # -------------------------
+    with tab3:
+        st.markdown("### ⏱️ 시간 내 도달 가능한 역")
+        st.markdown("출발역에서 정해진 시간 안에 갈 수 있는 모든 역을 찾아드립니다.")
+
+        iso_start = station_picker("📍 출발역", "iso_start", station_autocomplete)
+        iso_budget = st.slider(
+            "⏱️ 이동 시간 (분)", min_value=5, max_value=120, value=30, step=5, key="iso_budget"
+        )
+
+        if st.button("🔍 도달 범위 찾기", type="primary", use_container_width=True, key="iso_btn"):
+            if not iso_start:
+                st.error("출발역을 선택해주세요.")
+            else:
+                # 예산을 넘는 역은 확정·확장하지 않는 제한 탐색
+                dijkstra = Dijkstra(graph)
+                reached = dijkstra.getWithin(iso_start, iso_budget)
+                st.session_state["mode"] = "isochrone"
+                st.session_state["iso_result"] = {
+                    "start": iso_start,
+                    "budget": iso_budget,
+                    "reached": reached,
+                    "settled": dijkstra.settled,
+                }
+
+        iso_result = st.session_state.get("iso_result")
+        if st.session_state.get("mode") == "isochrone" and iso_result:
+            # 호선별 노드를 물리적 역 하나로 합쳐 가장 빠른 도착 시간만 표시
+            iso_stations = {}
+            for node, minutes in iso_result["reached"].items():
+                name = node.split("(")[0]
+                if name not in iso_stations or minutes < iso_stations[name]:
+                    iso_stations[name] = minutes
+            st.success(
+                f"✅ {iso_result['budget']}분 안에 역 {len(iso_stations)}곳에 갈 수 있습니다."
+            )
+            st.caption(f"탐색한 역 수: {iso_result['settled']} / {len(nodes)}")
+            st.dataframe(
+                [
+                    {"역": name, "소요시간(분)": round(minutes, 1)}
+                    for name, minutes in sorted(iso_stations.items(), key=lambda x: x[1])
+                ],
+                use_container_width=True,
+                hide_index=True,
+            )
+            st.session_state["iso_stations"] = iso_stations
+
 
 # -------------------------
 # 오른쪽: 지도 시각화
@@ -824,14 +1182,14 @@ with col2:
             if coords:
                 folium.PolyLine(
                     coords, color=color, weight=4, opacity=0.7,
-                    popup=f"{mp['person_idx']}번 사람 경로"
+                    popup=f"{mp['label']} 경로"
                 ).add_to(map_osm)
 
                 start_loc = coords[0]
                 folium.Marker(
                     start_loc,
-                    popup=f"{mp['person_idx']}번 출발",
-                    tooltip=f"{mp['person_idx']}번 출발",
+                    popup=f"{mp['label']} 출발",
+                    tooltip=f"{mp['label']} 출발",
                     icon=folium.Icon(color=color, icon='user', prefix='fa')
                 ).add_to(map_osm)
 
@@ -864,7 +1222,7 @@ with col2:
         for idx, mp in enumerate(meeting_paths):
             color_emoji = colors_display[idx % len(colors_display)]
             
-            with st.expander(f"{color_emoji} {mp['person_idx']}번 사람 이동경로", expanded=True):
+            with st.expander(f"{color_emoji} {mp['label']} 이동경로", expanded=len(meeting_paths) <= 5):
                 # 출발역 정보
                 start_station_display = mp['pathNames'][0] if mp['pathNames'] else mp['start_station']
                 st.markdown(f"""
@@ -908,6 +1266,53 @@ with col2:
             st.markdown("---")
             st.info("ℹ️ 만남역 주변 장소 정보를 찾지 못했습니다.")
 
+    # 3) 도달 범위 모드
+    elif mode == "isochrone" and "iso_stations" in st.session_state:
+        iso_result = st.session_state["iso_result"]
+        iso_stations = st.session_state["iso_stations"]
+        budget = iso_result["budget"]
+        start_name = iso_result["start"].split("(")[0]
+
+        center = subwayLoc.get(start_name, (37.5665, 126.9780))
+        map_osm = folium.Map(location=list(center), zoom_start=11)
+
+        # 먼 역부터 그려 가까운 역 마커가 위에 보이도록
+        for name, minutes in sorted(iso_stations.items(), key=lambda x: -x[1]):
+            loc = subwayLoc.get(name)
+            if loc is None:
+                continue
+            color = isochrone_color(minutes, budget)
+            folium.CircleMarker(
+                loc,
+                radius=7,
+                popup=f"{name} ({minutes:.1f}분)",
+                tooltip=f"{name} {minutes:.1f}분",
+                color=color,
+                fill=True,
+                fill_color=color,
+                fillOpacity=0.8
+            ).add_to(map_osm)
+
+        if start_name in subwayLoc:
+            folium.Marker(
+                subwayLoc[start_name],
+                popup=f"출발: {start_name}",
+                tooltip=f"출발: {start_name}",
+                icon=folium.Icon(color='green', icon='play', prefix='fa')
+            ).add_to(map_osm)
+
+        st.markdown('<div class="map-container">', unsafe_allow_html=True)
+        st.components.v1.html(map_osm._repr_html_(), width=700, height=550)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        # 색상 범례 (예산을 같은 간격으로 나눈 구간)
+        step = budget / len(ISOCHRONE_COLORS)
+        legend = " ".join(
+            f'<span style="color: {color};">●</span> {i * step:.0f}~{(i + 1) * step:.0f}분'
+            for i, color in enumerate(ISOCHRONE_COLORS)
+        )
+        st.markdown(f"**범례:** {legend}", unsafe_allow_html=True)
+
     else:
         default_map = folium.Map(location=[37.5665, 126.9780], zoom_start=11)
         st.markdown('<div class="map-container">', unsafe_allow_html=True)
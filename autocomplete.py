@@ -0,0 +1,124 @@
+from station_names import normalize_station_name, split_node_name
+
+# 자동완성 결과 개수 기본값과, 트라이 노드마다 미리 정렬해 두는 후보 수 상한
+DEFAULT_LIMIT = 20
+MAX_CANDIDATES = 50
+
+# 한글 음절 분해용 호환 자모 (초성 19, 중성 21, 종성 27 + 없음)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ",
+             "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 겹모음/겹받침은 입력 도중 상태와 맞도록 낱자로 나눈다 (예: "과" 입력 중 "고" -> ㄱㅗ 까지 일치)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+
+def to_jamo(text):
+    """
+    문자열 -> 낱자 문자열 (예: "강남" -> "ㄱㅏㅇㄴㅏㅁ", "ㄱㄴ" -> "ㄱㄴ").
+    음절은 초성/중성/종성으로, 겹모음/겹받침은 낱자로 나누고 영문은 소문자로 바꾼다.
+    """
+    out = []
+    for ch in text.lower():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            out.append(CHOSEONG[offset // 588])
+            jung = JUNGSEONG[(offset % 588) // 28]
+            out.append(COMPOUND_JAMO.get(jung, jung))
+            jong = JONGSEONG[offset % 28]
+            out.append(COMPOUND_JAMO.get(jong, jong))
+        else:
+            out.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+def to_choseong(text):
+    """문자열 -> 초성 문자열 (예: "강남" -> "ㄱㄴ", 한글 음절이 아닌 글자는 그대로)"""
+    out = []
+    for ch in text.lower():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            out.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+# =========================
+# 역 이름 자동완성 (낱자 트라이)
+# =========================
+class StationAutocomplete:
+    """
+    역 이름을 낱자로 풀어 넣은 트라이. 한 노드ID에 대해 다음 키를 넣는다.
+      - 역 이름 ("강남", '역'을 붙인 "서울역"도), 역 이름 + 호선 ("강남2"), 부역명 ("백남준아트센터")
+      - 위 각각의 초성 ("ㄱㄴ", "ㅂㄴㅈㅇㅌㅅㅌ")
+    질의도 낱자로 풀어 트라이를 따라가므로 완성된 음절, 입력 중인 음절("강나" -> 강남),
+    초성("ㄱㄴ"), 이들이 섞인 입력("강ㄴ")이 모두 접두어로 일치한다.
+    트라이 노드마다 후보를 (이름 길이, 호선 수 역순, 이름) 순으로 미리 정렬해 두어
+    질의는 입력 길이만큼 따라간 뒤 목록을 자르는 것으로 끝난다.
+    """
+
+    def __init__(self, names, max_candidates=MAX_CANDIDATES):
+        names = sorted(names)
+        line_count = {}
+        for name in names:
+            base = normalize_station_name(split_node_name(name)[0])
+            line_count[base] = line_count.get(base, 0) + 1
+
+        self.children = [{}]
+        buckets = [set()]
+        for name in names:
+            base, aliases, line = split_node_name(name)
+            key_base = normalize_station_name(base)
+            raw_base = base.replace(" ", "")  # '역'을 떼지 않은 이름 (예: "서울역")
+            keys = {to_jamo(raw_base), to_jamo(raw_base + line), to_jamo(key_base + line),
+                    to_choseong(key_base) + line.lower()}
+            for word in [key_base] + [normalize_station_name(a) for a in aliases]:
+                keys.add(to_jamo(word))
+                keys.add(to_choseong(word))
+            for key in keys:
+                node = 0
+                for ch in key:
+                    nxt = self.children[node].get(ch)
+                    if nxt is None:
+                        nxt = self.children[node][ch] = len(self.children)
+                        self.children.append({})
+                        buckets.append(set())
+                    node = nxt
+                    buckets[node].add(name)
+
+        def rank(name):
+            base = normalize_station_name(split_node_name(name)[0])
+            return len(base), -line_count[base], name
+
+        self.candidates = [sorted(bucket, key=rank)[:max_candidates] for bucket in buckets]
+        self.bases = {name: normalize_station_name(split_node_name(name)[0]) for name in names}
+
+    def complete(self, query, limit=DEFAULT_LIMIT):
+        """
+        query로 시작하는 역 노드ID 상위 limit개 (빈 입력이면 []).
+        입력한 음절 그대로 시작하는 역("고" -> 고덕)을 낱자로만 일치하는 역(공덕)보다 앞에 둔다.
+        """
+        text = query.replace(" ", "").replace("(", "").replace(")", "").strip()
+        if len(text) > 1 and text.endswith("역"):
+            text = text[:-1]
+        node = 0
+        for ch in to_jamo(text):
+            node = self.children[node].get(ch)
+            if node is None:
+                return []
+        if node == 0:
+            return []
+        bases = self.bases
+        found = sorted(self.candidates[node], key=lambda name: not bases[name].startswith(text))
+        return found[:limit]
+
+    def __len__(self):
+        return len(self.children)
@@ -0,0 +1,222 @@
+import argparse
+import csv
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from graph_artifact import load_or_build
+from station_names import StationNameIndex
+from subway_routing import (
+    AVG_SPEED_KMH, INF, ShortestPathTree, get_path_distance_and_time, multi_source_tree
+)
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+GRAPH_ARTIFACT = BASE_DIR / "subway_graph.npz"
+
+# 한 번에 읽어 출발역별로 묶는 OD 쌍 개수 (메모리 사용량 상한)
+DEFAULT_CHUNK_SIZE = 20000
+# 여러 chunk에 걸쳐 보관하는 출발역 트리 개수 (LRU, 같은 출발역을 다시 탐색하지 않도록)
+DEFAULT_TREE_CACHE_SIZE = 1024
+
+OUTPUT_FIELDS = ["row", "origin", "destination", "path", "distance_km", "time_min", "error"]
+
+# 프로세스 풀 작업자가 공유하는 그래프와 역 이름 색인 (initializer로 작업자마다 한 번만 전달)
+_worker_graph = None
+_worker_names = None
+
+
+def _init_worker(graph, name_index):
+    global _worker_graph, _worker_names
+    _worker_graph = graph
+    _worker_names = name_index
+
+
+def origin_tree(graph, name_index, origin):
+    """
+    출발역(노드ID 또는 역 이름)에서 전체 탐색을 한 번 수행한 ShortestPathTree (알 수 없는 역이면 None).
+    역 이름은 그 역의 모든 호선에서 동시에 출발하는 탐색이다.
+    """
+    origin_nodes = name_index.lookup(origin)
+    if not origin_nodes:
+        return None
+    return multi_source_tree(graph, dict.fromkeys(origin_nodes, 0.0))
+
+
+def route_with_tree(graph, name_index, origin, tree, destinations):
+    """
+    출발역 트리(tree, 없으면 None)로 여러 도착역 경로를 복원한다.
+    도착역이 역 이름이면 가장 빨리 닿는 호선으로 본다.
+    destinations: [(행 번호, 도착역), ...]
+    반환: 출력 행(dict) 목록
+    """
+    rows = []
+    for row, destination in destinations:
+        result = {"row": row, "origin": origin, "destination": destination,
+                  "path": "", "distance_km": "", "time_min": "", "error": ""}
+        destination_nodes = name_index.lookup(destination)
+        if tree is None:
+            result["error"] = f"알 수 없는 출발역: {origin}"
+        elif not destination_nodes:
+            result["error"] = f"알 수 없는 도착역: {destination}"
+        else:
+            end = min(destination_nodes, key=tree.costTo)
+            if tree.costTo(end) == INF:
+                result["error"] = "도달 불가"
+            else:
+                path = tree.pathTo(end)
+                dist, t = get_path_distance_and_time(path, graph)
+                result["path"] = "|".join(path)
+                result["distance_km"] = f"{dist:.3f}"
+                result["time_min"] = f"{t:.2f}"
+        rows.append(result)
+    return rows
+
+
+def route_origin(graph, name_index, origin, destinations):
+    """한 출발역에서 전체 탐색을 한 번만 하고, 그 트리로 여러 도착역 경로를 복원한다."""
+    tree = origin_tree(graph, name_index, origin)
+    return route_with_tree(graph, name_index, origin, tree, destinations)
+
+
+def _route_origin_task(task):
+    # 결과 행과 함께 트리 배열도 돌려줘 부모 프로세스가 다음 chunk에서 재사용하게 한다
+    # (ShortestPathTree를 그대로 보내면 그래프까지 직렬화되므로 배열만)
+    origin, destinations = task
+    tree = origin_tree(_worker_graph, _worker_names, origin)
+    rows = route_with_tree(_worker_graph, _worker_names, origin, tree, destinations)
+    if tree is None:
+        return rows, None
+    return rows, (tree.source, tree.dist, tree.parent)
+
+
+def group_by_origin(pairs):
+    """[(행 번호, 출발역, 도착역)] -> [(출발역, [(행 번호, 도착역), ...])] (출발역 첫 등장 순서)"""
+    groups = {}
+    for row, origin, destination in pairs:
+        groups.setdefault(origin, []).append((row, destination))
+    return list(groups.items())
+
+
+def route_batch(pairs, graph, name_index, executor=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                tree_cache_size=DEFAULT_TREE_CACHE_SIZE):
+    """
+    OD 쌍 이터레이터 [(행 번호, 출발역, 도착역), ...]를 chunk_size개씩 읽어
+    출발역별로 묶어 계산하고, 결과 행을 입력 순서대로 하나씩 내보내는 제너레이터.
+    출발역 트리는 chunk를 넘어 최대 tree_cache_size개까지 LRU로 보관하므로, 보관 중인
+    출발역은 다음 chunk에 다시 나와도 탐색하지 않고 경로만 복원한다.
+    executor(프로세스 풀)가 주어지면 트리가 없는 출발역 묶음만 작업자에게 나눠 보내고,
+    작업자가 돌려준 트리 배열을 캐시에 넣는다.
+    한 번에 메모리에 두는 것은 chunk 하나와 트리 캐시뿐이라 입력 크기와 무관하게 사용량이 일정하다.
+    """
+    trees = OrderedDict()  # 출발역 -> ShortestPathTree (알 수 없는 역은 None)
+    pairs = iter(pairs)
+    while True:
+        chunk = list(islice(pairs, chunk_size))
+        if not chunk:
+            return
+        chunk_rows = []
+        missing = []
+        for origin, dests in group_by_origin(chunk):
+            if origin in trees:
+                trees.move_to_end(origin)
+                chunk_rows.extend(route_with_tree(graph, name_index, origin, trees[origin], dests))
+            else:
+                missing.append((origin, dests))
+
+        if executor is None:
+            for origin, dests in missing:
+                tree = origin_tree(graph, name_index, origin)
+                chunk_rows.extend(route_with_tree(graph, name_index, origin, tree, dests))
+                trees[origin] = tree
+        else:
+            results = executor.map(_route_origin_task, missing, chunksize=8)
+            for (origin, _), (rows, arrays) in zip(missing, results):
+                chunk_rows.extend(rows)
+                tree = None
+                if arrays is not None:
+                    source, dist, parent = arrays
+                    tree = ShortestPathTree(graph, source, "time", dist, parent)
+                trees[origin] = tree
+        while len(trees) > tree_cache_size:
+            trees.popitem(last=False)
+
+        chunk_rows.sort(key=lambda r: r["row"])
+        yield from chunk_rows
+
+
+def read_pairs(path, origin_col, destination_col):
+    """입력 CSV에서 (행 번호, 출발역, 도착역)을 한 줄씩 읽는 제너레이터"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = {origin_col, destination_col} - set(reader.fieldnames or [])
+        if missing:
+            raise SystemExit(f"입력 CSV에 열이 없습니다: {', '.join(sorted(missing))}")
+        for row, line in enumerate(reader, start=1):
+            yield row, line[origin_col].strip(), line[destination_col].strip()
+
+
+def positive_int(text):
+    """argparse 타입: 1 이상의 정수"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {text}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {text}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OD 쌍 CSV의 최단 경로를 일괄 계산해 CSV로 저장")
+    parser.add_argument("input", help="출발역/도착역 열이 있는 입력 CSV")
+    parser.add_argument("output", help="결과 CSV 경로 ('-'이면 표준 출력)")
+    parser.add_argument("--origin-col", default="origin", help="출발역 열 이름 (기본: origin)")
+    parser.add_argument("--destination-col", default="destination",
+                        help="도착역 열 이름 (기본: destination)")
+    parser.add_argument("--workers", type=positive_int, default=None,
+                        help="프로세스 수 (기본: CPU 수, 1이면 풀 없이 실행)")
+    parser.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"한 번에 묶어 처리할 OD 쌍 수 (기본: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--tree-cache", type=positive_int, default=DEFAULT_TREE_CACHE_SIZE,
+                        help=f"chunk를 넘어 보관할 출발역 트리 수 (기본: {DEFAULT_TREE_CACHE_SIZE})")
+    args = parser.parse_args(argv)
+
+    _, _, graph = load_or_build(SUBWAY_CSV, SUBWAY_LOCATION_CSV, GRAPH_ARTIFACT, AVG_SPEED_KMH)
+    name_index = StationNameIndex(graph.names)
+    pairs = read_pairs(args.input, args.origin_col, args.destination_col)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8-sig", newline="")
+    executor = None
+    if args.workers != 1:
+        executor = ProcessPoolExecutor(
+            max_workers=args.workers, initializer=_init_worker, initargs=(graph, name_index)
+        )
+
+    t0 = time.perf_counter()
+    count = errors = 0
+    try:
+        writer = csv.DictWriter(out, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+        for result in route_batch(pairs, graph, name_index, executor, args.chunk_size,
+                                  args.tree_cache):
+            writer.writerow(result)
+            count += 1
+            errors += bool(result["error"])
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - t0
+    print(f"OD {count}쌍 처리 완료 (오류 {errors}쌍), {elapsed:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import time
+from pathlib import Path
+
+from autocomplete import StationAutocomplete, to_choseong
+from station_names import normalize_station_name, split_node_name
+from subway_routing import AVG_SPEED_KMH, load_subway_network
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+
+print("지하철 데이터 로드 중...")
+subwayLoc, nodes, graph = load_subway_network(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+
+t0 = time.perf_counter()
+autocomplete = StationAutocomplete(graph.names)
+print(f"트라이 노드 {len(autocomplete)}개, 구성 {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+# 모든 역 이름을 한 글자씩 입력하는 상황 (음절 입력 / 초성 입력)
+bases = sorted({normalize_station_name(split_node_name(name)[0]) for name in graph.names})
+keystrokes = [base[:i] for base in bases for i in range(1, len(base) + 1)]
+keystrokes += [to_choseong(base)[:i] for base in bases for i in range(1, len(base) + 1)]
+
+# =========================
+# 완성한 이름이 결과에 있는지 + 속도
+# =========================
+def found(base, query):
+    return base in {autocomplete.bases[name] for name in autocomplete.complete(query, limit=50)}
+
+
+missing = [base for base in bases if not found(base, base)]
+missing += [base for base in bases if not found(base, to_choseong(base))]
+print(f"역 이름 {len(bases)}개, 이름/초성 전체 입력 시 결과 없음: {len(missing)}개")
+
+t0 = time.perf_counter()
+for query in keystrokes:
+    autocomplete.complete(query)
+trie_us = (time.perf_counter() - t0) * 1e6 / len(keystrokes)
+
+# 비교: 전체 목록 부분 문자열 검색 (기존 selectbox 방식)
+t0 = time.perf_counter()
+for query in keystrokes:
+    [name for name in graph.names if query in name][:20]
+scan_us = (time.perf_counter() - t0) * 1e6 / len(keystrokes)
+print(f"입력 {len(keystrokes)}회, 트라이 {trie_us:.1f} us/입력, 전체 목록 검색 {scan_us:.1f} us/입력")
@@ -0,0 +1,86 @@
+import random
+import statistics
+import time
+from pathlib import Path
+
+from hub_labels import HubLabels
+from subway_routing import (
+    AVG_SPEED_KMH, INF, Dijkstra, get_path_distance_and_time, load_subway_network
+)
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+
+NUM_QUERIES = 20000  # 조회 속도 측정용 무작위 쌍 개수
+SEED = 42
+
+print("지하철 데이터 로드 중...")
+subwayLoc, nodes, graph = load_subway_network(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+n = graph.size
+
+labels = HubLabels(graph)
+sizes = labels.labelSizes()
+print(f"\n허브 라벨 전처리: {labels.preprocess_s * 1000:.1f} ms")
+print(f"라벨 항목 {len(labels.label_hubs)}개, 인덱스 {labels.index_bytes / 1024:.1f} KB "
+      f"(float32 전체 행렬 {n * n * 4 / 1024:.1f} KB)")
+
+# =========================
+# 역별 라벨 크기 통계
+# =========================
+values = sorted(sizes.values())
+print(f"역별 라벨 크기: 평균 {statistics.mean(values):.1f}, 중앙값 {statistics.median(values)}, "
+      f"최소 {values[0]}, 최대 {values[-1]}")
+print("라벨이 가장 큰 역: " + ", ".join(
+    f"{name}({size})" for name, size in sorted(sizes.items(), key=lambda x: -x[1])[:10]
+))
+print("라벨이 가장 작은 역: " + ", ".join(
+    f"{name}({size})" for name, size in sorted(sizes.items(), key=lambda x: x[1])[:10]
+))
+print("라벨 크기 분포:")
+for lo in range(0, values[-1] + 1, 5):
+    count = sum(1 for v in values if lo <= v < lo + 5)
+    print(f"  {lo:>3}~{lo + 4:<3} {count:>4}  {'#' * (count // 5)}")
+
+# =========================
+# 온라인 탐색과 전수 비교
+# =========================
+print("\n온라인 탐색과 전수 비교 중...")
+cost_errors = 0
+path_errors = 0
+for start in graph.names:
+    dijkstra = Dijkstra(graph)
+    dijkstra.getTree(start)
+    for end in graph.names:
+        expected = dijkstra.costTo(end)
+        got = labels.costTo(start, end)
+        if expected == INF or got == INF:
+            cost_errors += expected != got
+            continue
+        if abs(got - expected) > 1e-9:
+            cost_errors += 1
+            continue
+        path = labels.pathTo(start, end)
+        _, path_time = get_path_distance_and_time(path, graph)
+        if path[0] != start or path[-1] != end or abs(path_time - expected) > 1e-9:
+            path_errors += 1
+print(f"비교한 쌍: {n * n}개, 시간 불일치: {cost_errors}개, 경로 불일치: {path_errors}개")
+
+# 조회 속도
+random.seed(SEED)
+pairs = [(random.choice(graph.names), random.choice(graph.names)) for _ in range(NUM_QUERIES)]
+t0 = time.perf_counter()
+for start, end in pairs:
+    labels.costTo(start, end)
+cost_us = (time.perf_counter() - t0) * 1e6 / len(pairs)
+t0 = time.perf_counter()
+for start, end in pairs[:2000]:
+    labels.pathTo(start, end)
+path_us = (time.perf_counter() - t0) * 1e6 / 2000
+t0 = time.perf_counter()
+for start, end in pairs[:2000]:
+    Dijkstra(graph).getPath(start, end)
+dijkstra_us = (time.perf_counter() - t0) * 1e6 / 2000
+print(f"시간 조회: {cost_us:.1f} us / 경로 복원 포함: {path_us:.1f} us / "
+      f"Dijkstra 경로 탐색: {dijkstra_us:.1f} us")
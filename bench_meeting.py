@@ -0,0 +1,80 @@
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+
+from meeting import find_best_meeting_station, find_best_meeting_station_pruned
+from subway_routing import AVG_SPEED_KMH, Dijkstra, TreeCache, load_subway_network
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+
+NUM_GROUPS = 300  # 무작위 그룹 개수
+SEED = 42
+
+print("지하철 데이터 로드 중...")
+subwayLoc, nodes, graph = load_subway_network(
+    SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH
+)
+station_list = sorted(nodes)
+random.seed(SEED)
+
+
+def nearby_group(size, radius_min=25):
+    # 한 역 주변(radius_min분 이내)에 모여 사는 그룹
+    center = random.choice(station_list)
+    tree = TreeCache(graph, maxsize=1).get(center)
+    near = [name for name in station_list if tree.costTo(name) <= radius_min]
+    return [random.choice(near) for _ in range(size)]
+
+
+def spread_group(size):
+    # 노선도 전체에 흩어진 그룹
+    return [random.choice(station_list) for _ in range(size)]
+
+
+for label, make_group in [("가까운 그룹", nearby_group), ("흩어진 그룹", spread_group)]:
+    for objective in ("sum", "max", "weighted"):
+        groups = [make_group(random.randint(2, 6)) for _ in range(NUM_GROUPS)]
+        group_weights = [[random.choice([0.5, 1.0, 2.0]) for _ in g] for g in groups]
+
+        full_ms = pruned_ms = 0.0
+        full_settled = pruned_settled = 0
+        score_mismatches = station_mismatches = 0
+        for group, weights in zip(groups, group_weights):
+            weights = weights if objective == "weighted" else None
+
+            # 기준: 출발역별 전체 탐색 후 점수 계산 (캐시 없이 매번 새로 탐색)
+            t0 = time.perf_counter()
+            best, score, _, _ = find_best_meeting_station(
+                group, TreeCache(graph, maxsize=len(group)), objective, weights=weights
+            )
+            full_ms += time.perf_counter() - t0
+            # 기준 방식이 출발역마다 수행하는 전체 탐색을 시간 측정 밖에서 다시 돌려 확정 노드를 센다
+            for start in set(group):
+                dijkstra = Dijkstra(graph)
+                dijkstra.getTree(start)
+                full_settled += dijkstra.settled
+
+            t0 = time.perf_counter()
+            p_best, p_score, _, settled = find_best_meeting_station_pruned(
+                group, graph, objective, weights=weights
+            )
+            pruned_ms += time.perf_counter() - t0
+            pruned_settled += settled
+
+            if not np.isclose(score, p_score, rtol=0, atol=1e-9):
+                score_mismatches += 1
+            elif best != p_best:
+                station_mismatches += 1  # 허용 오차 안의 동점은 두 방식 모두 인덱스가 작은 역을 고름
+
+        print(f"\n[{label} / {objective}] {NUM_GROUPS}개 그룹 평균")
+        print(f"  전체 탐색  확정 노드 {full_settled / NUM_GROUPS:>8.1f}  "
+              f"{full_ms * 1000 / NUM_GROUPS:>7.3f} ms")
+        print(f"  가지치기   확정 노드 {pruned_settled / NUM_GROUPS:>8.1f}  "
+              f"{pruned_ms * 1000 / NUM_GROUPS:>7.3f} ms  "
+              f"({pruned_settled / full_settled:.1%})")
+        print(f"  점수 불일치 {score_mismatches}개, 만남역 불일치 {station_mismatches}개")
@@ -0,0 +1,113 @@
+import heapq
+import random
+import time
+from pathlib import Path
+
+from raptor import RaptorEngine, format_clock, load_line_schedule
+from subway_routing import AVG_SPEED_KMH, INF, load_subway_network
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+LINE_SCHEDULE_CSV = BASE_DIR / "line_schedule.csv"
+
+NUM_QUERIES = 2000  # 무작위 (출발역, 도착역, 출발 시각) 질의 개수
+MAX_ROUNDS = 16     # 비교용: 최단 도착 시각이 라운드 수에 잘리지 않도록 넉넉하게
+SEED = 42
+
+
+def time_dependent_dijkstra(engine, start, end, depart):
+    """
+    비교 기준: (역) + (노선, 정차 순번) 상태로 시간 확장한 그래프의 시간 의존 Dijkstra.
+    역 -> 노선 탑승은 다음 열차까지 대기, 노선 안에서는 다음 정차역으로, 하차는 대기 없이.
+    FIFO(늦게 출발하면 늦게 도착)가 성립하므로 가장 이른 도착 시각이 정확히 나온다.
+    """
+    index = engine.graph.index
+    s, t = index[start], index[end]
+    best = {("stop", s): depart}
+    heap = [(depart, ("stop", s))]
+    done = set()
+    while heap:
+        clock, state = heapq.heappop(heap)
+        if state in done:
+            continue
+        done.add(state)
+        if state == ("stop", t):
+            return clock
+        moves = []
+        if state[0] == "stop":
+            p = state[1]
+            for r, i in engine.routes_at[p]:
+                offs = engine.route_offsets[r]
+                dep = engine.nextDeparture(r, clock - offs[i])
+                if dep is not None:
+                    moves.append((dep + offs[i], ("route", r, i)))
+            for v in engine.footpaths[p]:
+                moves.append((clock + engine.transfer_min, ("stop", v)))
+        else:
+            _, r, i = state
+            stops, offs = engine.route_stops[r], engine.route_offsets[r]
+            moves.append((clock, ("stop", stops[i])))
+            if i + 1 < len(stops):
+                moves.append((clock + offs[i + 1] - offs[i], ("route", r, i + 1)))
+        for arr, nxt in moves:
+            if arr < best.get(nxt, INF):
+                best[nxt] = arr
+                heapq.heappush(heap, (arr, nxt))
+    return INF
+
+
+print("지하철 데이터 로드 중...")
+subwayLoc, nodes, graph = load_subway_network(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+schedule = load_line_schedule(LINE_SCHEDULE_CSV)
+engine = RaptorEngine(graph, schedule)
+print(f"노선(방향별) {engine.num_routes}개, 전처리 {engine.preprocess_s * 1000:.1f} ms")
+
+random.seed(SEED)
+queries = [
+    (random.choice(graph.names), random.choice(graph.names), random.randint(5 * 60, 24 * 60))
+    for _ in range(NUM_QUERIES)
+]
+
+# =========================
+# 도착 시각 비교 + 속도
+# =========================
+t0 = time.perf_counter()
+raptor_results = [engine.query(s, e, d, MAX_ROUNDS) for s, e, d in queries]
+raptor_ms = (time.perf_counter() - t0) * 1000 / len(queries)
+
+t0 = time.perf_counter()
+baseline = [time_dependent_dijkstra(engine, s, e, d) for s, e, d in queries]
+dijkstra_ms = (time.perf_counter() - t0) * 1000 / len(queries)
+
+mismatches = 0
+unreachable = 0
+rounds = []
+for journeys, expected in zip(raptor_results, baseline):
+    got = journeys[-1]["arrival"] if journeys else INF
+    if expected == INF:
+        unreachable += 1
+        mismatches += got != INF
+        continue
+    mismatches += abs(got - expected) > 1e-9
+    rounds.append(len(journeys))
+
+print(f"질의 {len(queries)}개, 도착 시각 불일치 {mismatches}개, 도달 불가 {unreachable}개")
+print(f"RAPTOR: {raptor_ms:.2f} ms/질의, 시간 의존 Dijkstra: {dijkstra_ms:.2f} ms/질의 "
+      f"({dijkstra_ms / raptor_ms:.1f}배)")
+print(f"질의당 파레토 여정(탑승 횟수별) 평균 {sum(rounds) / max(len(rounds), 1):.2f}개")
+
+# 예시 여정
+start, end, depart = "강남(2)", "서울역(1)", 8 * 60
+print(f"\n예시: {start} -> {end}, {format_clock(depart)} 출발")
+for journey in engine.query(start, end, depart):
+    print(f"  탑승 {journey['rides']}회, 환승 {journey['transfers']}회, "
+          f"도착 {format_clock(journey['arrival'])} "
+          f"({journey['duration']:.1f}분)")
+    for leg in journey["legs"]:
+        if leg["type"] == "ride":
+            print(f"    [{leg['line']}] {leg['from']} {format_clock(leg['depart'])} -> "
+                  f"{leg['to']} {format_clock(leg['arrive'])}")
+        else:
+            print(f"    환승 {leg['from']} -> {leg['to']}")
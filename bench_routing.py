@@ -0,0 +1,136 @@
+import random
+import time
+from pathlib import Path
+
+from contraction import CHDijkstra, ContractionHierarchy
+from landmarks import build_landmarks
+from subway_routing import AVG_SPEED_KMH, Dijkstra, load_subway_network
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+
+NUM_QUERIES = 500  # 무작위 출발-도착 쌍 개수
+SEED = 42
+
+print("지하철 데이터 로드 중...")
+subwayLoc, nodes, graph = load_subway_network(
+    SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH
+)
+dijkstra = Dijkstra(graph)
+print(f"노드 {len(nodes)}개, 좌표 보유 {sum(graph.has_coord)}개, "
+      f"휴리스틱 배율 {graph.heuristic_scale:.3f}")
+
+ch = ContractionHierarchy(graph)
+ch_query = CHDijkstra(ch)
+
+# 랜드마크 개수별 ALT 인덱스
+alt_indexes = {}
+for k in (8, 12, 16):
+    t0 = time.perf_counter()
+    alt_indexes[k] = build_landmarks(graph, k)
+    print(f"ALT({k}) 전처리: {(time.perf_counter() - t0) * 1000:.1f} ms")
+print("랜드마크(12): " + ", ".join(graph.names[i] for i in alt_indexes[12].landmarks))
+print(f"CH 전처리: {ch.preprocess_s * 1000:.1f} ms, 지름길 {ch.shortcuts}개, "
+      f"상향 간선 {len(ch.up_targets)}개, 인덱스 {ch.index_bytes / 1024:.1f} KB")
+
+random.seed(SEED)
+station_list = sorted(nodes)
+pairs = [tuple(random.sample(station_list, 2)) for _ in range(NUM_QUERIES)]
+
+
+def run_full(start, end):
+    # 기존 방식: 모든 노드를 확정한 뒤 경로 복원
+    dijkstra.reset()
+    dijkstra.getTree(start)
+    return dijkstra.pathTo(start, end)
+
+
+def run_p2p(start, end):
+    dijkstra.reset()
+    return dijkstra.getPath(start, end)
+
+
+def run_bidirectional(start, end):
+    dijkstra.reset()
+    return dijkstra.getPathBidirectional(start, end)
+
+
+def run_astar(start, end):
+    dijkstra.reset()
+    return dijkstra.getPath(start, end, astar=True)
+
+
+def run_alt(k):
+    def run(start, end):
+        dijkstra.reset()
+        return dijkstra.getPath(start, end, landmarks=alt_indexes[k])
+    return run
+
+
+def run_ch(start, end):
+    ch_query.reset()
+    return ch_query.getPath(start, end)
+
+
+def run_astar_uncalibrated(start, end):
+    # 참고용: 배율 보정 없이 직선거리 그대로 사용 (최적성 보장 안 됨)
+    calibrated = graph.heuristic_scale
+    graph.heuristic_scale = 1.0
+    try:
+        return run_astar(start, end)
+    finally:
+        graph.heuristic_scale = calibrated
+
+
+# 기준 비용 (전체 탐색 결과)
+reference = {}
+for start, end in pairs:
+    run_full(start, end)
+    reference[(start, end)] = dijkstra.costTo(end)
+
+print(f"\n무작위 {NUM_QUERIES}개 쌍 기준 (평균)")
+print(f"{'방식':<12}{'확정 노드':>10}{'비율':>8}{'시간(ms)':>10}{'오차':>6}")
+for label, fn, engine in [("전체 탐색", run_full, dijkstra), ("조기 종료", run_p2p, dijkstra),
+                          ("양방향", run_bidirectional, dijkstra), ("A*", run_astar, dijkstra),
+                          ("A*(보정X)", run_astar_uncalibrated, dijkstra),
+                          ("ALT(8)", run_alt(8), dijkstra), ("ALT(12)", run_alt(12), dijkstra),
+                          ("ALT(16)", run_alt(16), dijkstra),
+                          ("CH", run_ch, ch_query)]:
+    total_settled = 0
+    mismatches = 0
+    t0 = time.perf_counter()
+    for start, end in pairs:
+        fn(start, end)
+        total_settled += engine.settled
+        if abs(engine.costTo(end) - reference[(start, end)]) > 1e-9:
+            mismatches += 1
+    elapsed_ms = (time.perf_counter() - t0) * 1000 / len(pairs)
+    avg_settled = total_settled / len(pairs)
+    print(f"{label:<12}{avg_settled:>10.1f}{avg_settled / len(nodes):>8.1%}"
+          f"{elapsed_ms:>10.3f}{mismatches:>6}")
+
+# =========================
+# 양방향 탐색 전수 검증 (모든 출발-도착 쌍)
+# =========================
+print("\n양방향 탐색 전수 검증 중...")
+cost_mismatches = 0
+path_differences = 0
+checked = 0
+for start in station_list:
+    dijkstra.reset()
+    dijkstra.getTree(start)
+    tree_cost = {node: dijkstra.costTo(node) for node in station_list}
+    tree_paths = {node: dijkstra.pathTo(start, node) for node in station_list}
+    for end in station_list:
+        path = run_bidirectional(start, end)
+        # 동일 비용 대안 경로는 부동소수 합산 순서만 다를 수 있으므로 허용 오차로 비교
+        if abs(dijkstra.costTo(end) - tree_cost[end]) > 1e-9:
+            cost_mismatches += 1
+        # 같은 비용의 대안 경로는 만난 지점에 따라 달라질 수 있다 (앱의 탐색 방식 도움말에 명시)
+        if path != tree_paths[end]:
+            path_differences += 1
+        checked += 1
+print(f"검사한 쌍: {checked}개, 비용 불일치: {cost_mismatches}개, "
+      f"경로 상이(동일 비용 대안): {path_differences}개")
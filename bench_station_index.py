@@ -0,0 +1,77 @@
+import random
+import time
+from pathlib import Path
+
+from station_index import StationIndex
+from subway_routing import AVG_SPEED_KMH, haversine_km, load_subway_network
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+
+NUM_POINTS = 20000  # 무작위 주소(좌표) 개수
+K = 3
+RADIUS_KM = 1.0
+SEED = 42
+
+print("지하철 데이터 로드 중...")
+subwayLoc, nodes, graph = load_subway_network(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+
+t0 = time.perf_counter()
+index = StationIndex(subwayLoc)
+print(f"역 좌표 {len(index)}개, KD-tree 구성 {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+# 역 좌표 범위 안의 무작위 지점
+lats = [lat for lat, _ in subwayLoc.values()]
+lngs = [lng for _, lng in subwayLoc.values()]
+random.seed(SEED)
+points = [(random.uniform(min(lats), max(lats)), random.uniform(min(lngs), max(lngs)))
+          for _ in range(NUM_POINTS)]
+
+
+def linear_nearest(lat, lng, k):
+    dists = sorted((haversine_km(lat, lng, a, b), name) for name, (a, b) in subwayLoc.items())
+    return [(name, d) for d, name in dists[:k]]
+
+
+def linear_within(lat, lng, radius_km):
+    dists = sorted((haversine_km(lat, lng, a, b), name) for name, (a, b) in subwayLoc.items())
+    return [(name, d) for d, name in dists if d <= radius_km]
+
+
+# =========================
+# 선형 탐색과 결과 비교 + 속도
+# =========================
+sample = points[:2000]
+# 좌표가 같은 역(예: "신내"/"신내역")은 순서가 갈릴 수 있으므로 거리로 비교
+nearest_errors = sum(
+    any(abs(a - b) > 1e-6 for (_, a), (_, b) in zip(index.nearest(lat, lng, K), linear_nearest(lat, lng, K)))
+    for lat, lng in sample
+)
+within_errors = sum(
+    {name for name, _ in index.within(lat, lng, RADIUS_KM)}
+    != {name for name, _ in linear_within(lat, lng, RADIUS_KM)}
+    for lat, lng in sample
+)
+dist_error = max(
+    abs(d - haversine_km(lat, lng, *subwayLoc[name]))
+    for lat, lng in sample for name, d in index.nearest(lat, lng, K)
+)
+print(f"비교한 지점 {len(sample)}개, 최근접 {K}개 불일치 {nearest_errors}개, "
+      f"반경 {RADIUS_KM} km 불일치 {within_errors}개, 거리 최대 오차 {dist_error * 1000:.4f} m")
+
+t0 = time.perf_counter()
+for lat, lng in points:
+    index.nearest(lat, lng, K)
+kd_us = (time.perf_counter() - t0) * 1e6 / len(points)
+t0 = time.perf_counter()
+for lat, lng in points:
+    index.within(lat, lng, RADIUS_KM)
+within_us = (time.perf_counter() - t0) * 1e6 / len(points)
+t0 = time.perf_counter()
+for lat, lng in sample:
+    linear_nearest(lat, lng, K)
+linear_us = (time.perf_counter() - t0) * 1e6 / len(sample)
+print(f"KD-tree 최근접 {K}개: {kd_us:.1f} us, 반경 {RADIUS_KM} km: {within_us:.1f} us, "
+      f"선형 하버사인 탐색: {linear_us:.1f} us ({linear_us / kd_us:.0f}배)")
@@ -0,0 +1,44 @@
+import time
+from pathlib import Path
+
+from graph_artifact import load_artifact, save_artifact, source_hash
+from landmarks import build_landmarks, load_landmarks, save_landmarks
+from subway_routing import AVG_SPEED_KMH, load_subway_network
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+ARTIFACT_PATH = BASE_DIR / "subway_graph.npz"
+LANDMARK_PATH = BASE_DIR / "subway_landmarks.npz"
+
+print("CSV에서 그래프 구성 중...")
+t0 = time.perf_counter()
+subwayLoc, nodes, graph = load_subway_network(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+csv_ms = (time.perf_counter() - t0) * 1000
+
+key = source_hash(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+save_artifact(ARTIFACT_PATH, subwayLoc, graph, key)
+
+t0 = time.perf_counter()
+loaded = load_artifact(ARTIFACT_PATH, key)
+artifact_ms = (time.perf_counter() - t0) * 1000
+if loaded is None or loaded[2].names != graph.names:
+    raise SystemExit("아티팩트 검증 실패: 다시 읽은 그래프가 원본과 다릅니다.")
+
+# ALT 랜드마크 인덱스 (그래프 아티팩트 옆에 같은 원본 해시로 저장)
+t0 = time.perf_counter()
+landmark_index = build_landmarks(graph)
+landmark_ms = (time.perf_counter() - t0) * 1000
+save_landmarks(LANDMARK_PATH, landmark_index, key)
+if load_landmarks(LANDMARK_PATH, graph, key) is None:
+    raise SystemExit("랜드마크 검증 실패: 저장한 파일을 다시 읽지 못했습니다.")
+
+print(f"\n완료! {ARTIFACT_PATH} 파일을 생성했습니다.")
+print(f"원본 해시: {key[:16]}...")
+print(f"노드 {graph.size}개, 간선(양방향) {len(graph.targets)}개, 역 좌표 {len(subwayLoc)}개")
+print(f"파일 크기: {ARTIFACT_PATH.stat().st_size / 1024:.1f} KB")
+print(f"CSV 구성: {csv_ms:.1f} ms / 아티팩트 로드: {artifact_ms:.1f} ms")
+print(f"랜드마크 {len(landmark_index.landmarks)}개 ({landmark_ms:.1f} ms): "
+      + ", ".join(graph.names[i] for i in landmark_index.landmarks))
+print(f"랜드마크 파일 크기: {LANDMARK_PATH.stat().st_size / 1024:.1f} KB")
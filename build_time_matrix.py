@@ -0,0 +1,84 @@
+import time
+from pathlib import Path
+
+import numpy as np
+
+from graph_artifact import source_hash
+from subway_routing import (
+    AVG_SPEED_KMH, INF, Dijkstra, get_path_distance_and_time, load_subway_network
+)
+from time_matrix import build_time_matrix, load_time_matrix, save_time_matrix
+
+# 파일 경로 설정
+BASE_DIR = Path(__file__).resolve().parent
+SUBWAY_CSV = BASE_DIR / "subway_merged.csv"
+SUBWAY_LOCATION_CSV = BASE_DIR / "subwayLocation.csv"
+MATRIX_PATH = BASE_DIR / "subway_time_matrix.bin"
+
+# float32 저장 오차 허용 범위(분)
+TOLERANCE_MIN = 1e-3
+
+print("지하철 데이터 로드 중...")
+subwayLoc, nodes, graph = load_subway_network(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+n = graph.size
+
+print(f"모든 역({n}개)에서 전체 탐색 중...")
+t0 = time.perf_counter()
+times, next_hop = build_time_matrix(graph)
+build_s = time.perf_counter() - t0
+
+key = source_hash(SUBWAY_CSV, SUBWAY_LOCATION_CSV, AVG_SPEED_KMH)
+save_time_matrix(MATRIX_PATH, times, next_hop, key)
+
+t0 = time.perf_counter()
+matrix = load_time_matrix(MATRIX_PATH, graph, key)
+open_ms = (time.perf_counter() - t0) * 1000
+if matrix is None:
+    raise SystemExit("행렬 파일 검증 실패: 헤더가 원본과 다릅니다.")
+
+# =========================
+# 온라인 탐색(Dijkstra)과 전수 비교
+# =========================
+print("온라인 탐색과 전수 비교 중...")
+cost_errors = 0
+path_errors = 0
+max_error = 0.0
+for s, start in enumerate(graph.names):
+    dijkstra = Dijkstra(graph)
+    dijkstra.getTree(start)
+    for t, end in enumerate(graph.names):
+        expected = dijkstra.dist[t]
+        got = float(matrix.times[s, t])
+        if expected == INF or got == INF:
+            if expected != got:
+                cost_errors += 1
+            continue
+        max_error = max(max_error, abs(got - expected))
+        if abs(got - expected) > TOLERANCE_MIN:
+            cost_errors += 1
+        # next-hop으로 복원한 경로의 실제 비용도 최단 비용과 같아야 함
+        path = matrix.pathTo(start, end)
+        _, path_time = get_path_distance_and_time(path, graph)
+        if path[0] != start or path[-1] != end or abs(path_time - expected) > TOLERANCE_MIN:
+            path_errors += 1
+
+# 조회 속도 비교 (무작위 쌍)
+rng = np.random.default_rng(42)
+pairs = [(graph.names[a], graph.names[b]) for a, b in rng.integers(0, n, size=(500, 2))]
+t0 = time.perf_counter()
+for start, end in pairs:
+    Dijkstra(graph).getPath(start, end)
+dijkstra_ms = (time.perf_counter() - t0) * 1000 / len(pairs)
+t0 = time.perf_counter()
+for start, end in pairs:
+    matrix.pathTo(start, end)
+lookup_ms = (time.perf_counter() - t0) * 1000 / len(pairs)
+
+print(f"\n완료! {MATRIX_PATH} 파일을 생성했습니다.")
+print(f"노드 {n}개 -> 시간 행렬 {times.nbytes / 1024:.1f} KB(float32) + "
+      f"next-hop {next_hop.nbytes / 1024:.1f} KB(int16)")
+print(f"파일 크기: {MATRIX_PATH.stat().st_size / 1024:.1f} KB")
+print(f"구성 시간: {build_s:.2f} s / memmap 열기: {open_ms:.2f} ms")
+print(f"비교한 쌍: {n * n}개, 비용 불일치: {cost_errors}개, 경로 불일치: {path_errors}개, "
+      f"최대 오차: {max_error:.2e} 분")
+print(f"경로 조회(평균): Dijkstra {dijkstra_ms:.3f} ms / 행렬 {lookup_ms:.3f} ms")
@@ -0,0 +1,248 @@
+import heapq
+import time
+from array import array
+
+from subway_routing import INF
+
+# 지름길(shortcut) 필요 여부를 확인하는 목격자(witness) 탐색의 최대 확정 노드 수
+# (한도 안에서 더 짧은 우회로를 못 찾으면 지름길을 추가하므로 결과의 정확성에는 영향 없음)
+WITNESS_SETTLE_LIMIT = 64
+
+
+# =========================
+# Contraction Hierarchy 전처리 (불변 인덱스)
+# =========================
+class ContractionHierarchy:
+    """
+    SubwayGraph의 노드를 중요도가 낮은 순서로 하나씩 축약(contract)하면서,
+    최단 경로가 사라지는 경우에만 지름길 간선을 추가해 만든 계층 인덱스.
+      - rank[i]: i번 노드의 축약 순서 (클수록 중요한 노드)
+      - up_offsets / up_targets / up_weights: 자기보다 rank가 높은 이웃으로만 가는 간선(CSR)
+      - up_middle: 지름길이면 축약된 가운데 노드, 원래 간선이면 -1
+    그래프가 무방향이므로 출발/도착 양쪽 탐색이 같은 상향(upward) 간선을 사용한다.
+    쿼리 상태는 CHDijkstra가 따로 가지므로 여러 세션이 하나의 인덱스를 공유해도 된다.
+    """
+
+    def __init__(self, graph):
+        t0 = time.perf_counter()
+        self.graph = graph
+        n = graph.size
+
+        # 축약 중 남아 있는 그래프: adj[u][v] = (시간(분), 가운데 노드)
+        adj = [dict() for _ in range(n)]
+        offsets, targets, weights = graph.offsets, graph.targets, graph.time_min
+        for u in range(n):
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if v != u and (v not in adj[u] or weights[k] < adj[u][v][0]):
+                    adj[u][v] = (weights[k], -1)
+
+        rank = array("i", [-1]) * n
+        contracted_neighbors = [0] * n
+        up_edges = [None] * n  # 축약 시점의 남은 이웃 = rank가 더 높은 이웃
+        shortcuts = 0
+
+        def priority(v):
+            # 간선 차이(추가될 지름길 수 - 없어지는 간선 수) + 이미 축약된 이웃 수
+            return len(self._shortcutsFor(adj, v)) - len(adj[v]) + contracted_neighbors[v]
+
+        heap = [(priority(v), v) for v in range(n)]
+        heapq.heapify(heap)
+        order = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            if rank[v] >= 0:
+                continue
+            # 우선순위는 늦게 갱신: 다시 계산해 더 나빠졌으면 힙에 되돌린다
+            current = priority(v)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, v))
+                continue
+
+            for a, b, w in self._shortcutsFor(adj, v):
+                if b not in adj[a] or w < adj[a][b][0]:
+                    if b not in adj[a]:
+                        shortcuts += 1
+                    adj[a][b] = (w, v)
+                    adj[b][a] = (w, v)
+
+            up_edges[v] = list(adj[v].items())
+            for u in adj[v]:
+                del adj[u][v]
+                contracted_neighbors[u] += 1
+            adj[v] = {}
+            rank[v] = order
+            order += 1
+
+        # 상향 간선 CSR 구성
+        up_offsets = array("i", [0]) * (n + 1)
+        up_targets = array("i")
+        up_weights = array("d")
+        up_middle = array("i")
+        for v in range(n):
+            for u, (w, middle) in up_edges[v]:
+                up_targets.append(u)
+                up_weights.append(w)
+                up_middle.append(middle)
+            up_offsets[v + 1] = len(up_targets)
+
+        self.rank = rank
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_weights = up_weights
+        self.up_middle = up_middle
+        # 지름길 펼치기용: (rank가 낮은 노드, 높은 노드) -> 상향 간선 위치
+        self._edge_at = {
+            (v, up_targets[k]): k
+            for v in range(n)
+            for k in range(up_offsets[v], up_offsets[v + 1])
+        }
+        self.shortcuts = shortcuts
+        self.preprocess_s = time.perf_counter() - t0
+
+    @staticmethod
+    def _shortcutsFor(adj, v):
+        """
+        v를 축약할 때 필요한 지름길 [(a, b, 시간)] 목록.
+        이웃 a에서 v를 거치지 않는 제한된 탐색으로 a-v-b보다 짧지 않은 우회로가 없을 때만 추가한다.
+        """
+        neighbors = list(adj[v].items())
+        result = []
+        for i, (a, (wa, _)) in enumerate(neighbors):
+            rest = neighbors[i + 1:]
+            if not rest:
+                continue
+            limit = wa + max(wb for _, (wb, _) in rest)
+
+            # 목격자 탐색 (v 제외, limit 이하 비용 / WITNESS_SETTLE_LIMIT개까지)
+            dist = {a: 0.0}
+            heap = [(0.0, a)]
+            settled = 0
+            while heap and settled < WITNESS_SETTLE_LIMIT:
+                du, u = heapq.heappop(heap)
+                if du > limit:
+                    break
+                if du > dist[u]:
+                    continue
+                settled += 1
+                for x, (w, _) in adj[u].items():
+                    if x == v:
+                        continue
+                    nd = du + w
+                    if nd < dist.get(x, INF):
+                        dist[x] = nd
+                        heapq.heappush(heap, (nd, x))
+
+            for b, (wb, _) in rest:
+                if dist.get(b, INF) > wa + wb:
+                    result.append((a, b, wa + wb))
+        return result
+
+    @property
+    def index_bytes(self):
+        """인덱스 배열 크기(바이트)"""
+        return sum(
+            arr.itemsize * len(arr)
+            for arr in (self.rank, self.up_offsets, self.up_targets, self.up_weights, self.up_middle)
+        )
+
+    def unpack(self, a, b, k):
+        """상향 간선 k(a-b, 방향 무관)를 원래 간선 경로로 펼쳐 a 다음부터 b까지의 노드 목록 반환"""
+        middle = self.up_middle[k]
+        if middle < 0:
+            return [b]
+        # 가운데 노드는 a, b보다 먼저 축약됐으므로 그 노드의 상향 간선에 a, b가 있다
+        return (self.unpack(a, middle, self._edge_at[(middle, a)])
+                + self.unpack(middle, b, self._edge_at[(middle, b)]))
+
+
+# =========================
+# Contraction Hierarchy 쿼리 (쿼리마다 생성)
+# =========================
+class CHDijkstra:
+    """
+    ContractionHierarchy 위에서 한 번의 양방향 상향 탐색 상태를 담는 객체.
+    Dijkstra와 같이 getPath(start, end) / costTo(end) / settled를 제공한다.
+    """
+
+    def __init__(self, ch):
+        self.ch = ch
+        self.graph = ch.graph
+        self.reset()
+
+    def reset(self):
+        self.cost = INF
+        self.end = None
+        self.settled = 0
+
+    def costTo(self, name):
+        """마지막 getPath 기준 도착역까지의 최소 비용(분)"""
+        return self.cost if name == self.end else INF
+
+    def getPath(self, start, end):
+        """
+        start와 end에서 각각 rank가 높아지는 방향으로만 탐색하고, 두 탐색이 만나는 노드 중
+        비용 합이 가장 작은 곳을 최단 경로의 꼭대기로 삼는다.
+        각 방향의 힙 최솟값이 지금까지의 최단 비용 이상이면 그 방향은 더 볼 필요가 없다.
+        """
+        ch, graph = self.ch, self.graph
+        s, t = graph.index[start], graph.index[end]
+        self.end = end
+        if s == t:
+            self.cost = 0.0
+            return [start]
+
+        up_offsets, up_targets, up_weights = ch.up_offsets, ch.up_targets, ch.up_weights
+        # 방향별 비용/부모(노드, 간선 위치) 딕셔너리 - 상향 탐색은 일부 노드만 방문
+        dist = ({s: 0.0}, {t: 0.0})
+        parent = ({s: (-1, -1)}, {t: (-1, -1)})
+        done = (set(), set())
+        heaps = ([(0.0, s)], [(0.0, t)])
+        best, meet = INF, -1
+
+        while heaps[0] or heaps[1]:
+            # 힙 최솟값이 작은 쪽부터 확장, 최단 비용 이상인 방향은 비움
+            side = 0 if not heaps[1] or (heaps[0] and heaps[0][0][0] <= heaps[1][0][0]) else 1
+            du, u = heapq.heappop(heaps[side])
+            if du >= best:
+                heaps[side].clear()
+                continue
+            if u in done[side]:
+                continue
+            done[side].add(u)
+            self.settled += 1
+
+            other = dist[1 - side].get(u)
+            if other is not None and du + other < best:
+                best, meet = du + other, u
+
+            d, p = dist[side], parent[side]
+            for k in range(up_offsets[u], up_offsets[u + 1]):
+                v = up_targets[k]
+                nd = du + up_weights[k]
+                if nd < d.get(v, INF):
+                    d[v] = nd
+                    p[v] = (u, k)
+                    heapq.heappush(heaps[side], (nd, v))
+
+        self.cost = best
+        if meet < 0:
+            return []
+
+        # s -> 꼭대기 (정방향 부모를 거꾸로 따라간 뒤 뒤집기)
+        up_path = []
+        cur = meet
+        while parent[0][cur][0] >= 0:
+            prev, k = parent[0][cur]
+            up_path.append((prev, cur, k))
+            cur = prev
+        path = [s]
+        for prev, nxt, k in reversed(up_path):
+            path.extend(ch.unpack(prev, nxt, k))
+        # 꼭대기 -> t (역방향 부모를 따라 내려감)
+        cur = meet
+        while parent[1][cur][0] >= 0:
+            nxt, k = parent[1][cur]
+            path.extend(ch.unpack(cur, nxt, k))
+            cur = nxt
+        return graph.pathNames(path)
@@ -0,0 +1,122 @@
+import sqlite3
+import threading
+import time
+import unicodedata
+
+# 기본 유효 기간(초)과 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 삭제)
+DEFAULT_TTL_S = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 20000
+# 다른 프로세스가 쓰는 중일 때 잠금을 기다리는 시간(초)
+BUSY_TIMEOUT_S = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    query TEXT PRIMARY KEY,
+    lat REAL NOT NULL,
+    lng REAL NOT NULL,
+    place_name TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS geocode_last_used ON geocode (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def normalize_query(query):
+    """캐시 키: 유니코드 NFC, 앞뒤 공백 제거, 연속 공백 하나로, 영문 소문자"""
+    return " ".join(unicodedata.normalize("NFC", query).split()).lower()
+
+
+# =========================
+# 장소 검색 결과 캐시 (SQLite)
+# =========================
+class GeocodeCache:
+    """
+    키워드 -> (위도, 경도, 장소 이름) 검색 결과를 SQLite 파일에 저장하는 캐시.
+      - ttl_s초가 지난 항목은 만료(조회 시 삭제), max_entries개를 넘으면 last_used가 가장 오래된 항목부터 삭제
+      - 적중/실패/삭제 횟수는 counters 테이블에 누적 (모든 세션과 프로세스 합계)
+    WAL 모드 + busy timeout으로 여러 프로세스(작업자)가 같은 파일을 함께 읽고 쓴다.
+    연결은 스레드마다 따로 연다 (sqlite3 연결은 스레드 간 공유 불가).
+    """
+
+    def __init__(self, path, ttl_s=DEFAULT_TTL_S, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = str(path)
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_S)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _count(conn, name, amount=1):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def get(self, query):
+        """캐시된 (lat, lng, place_name), 없거나 만료됐으면 None"""
+        key = normalize_query(query)
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT lat, lng, place_name, created FROM geocode WHERE query = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[3] > self.ttl_s:
+                conn.execute("DELETE FROM geocode WHERE query = ?", (key,))
+                self._count(conn, "expired")
+                row = None
+            if row is None:
+                self._count(conn, "misses")
+                return None
+            conn.execute("UPDATE geocode SET last_used = ? WHERE query = ?", (now, key))
+            self._count(conn, "hits")
+        return row[0], row[1], row[2]
+
+    def put(self, query, lat, lng, place_name):
+        """검색 결과 저장 후 최대 항목 수를 넘은 만큼 오래 안 쓴 항목 삭제"""
+        key = normalize_query(query)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode (query, lat, lng, place_name, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, lat, lng, place_name, now, now),
+            )
+            excess = conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM geocode WHERE query IN "
+                    "(SELECT query FROM geocode ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+                self._count(conn, "evictions", excess)
+
+    def stats(self):
+        """{"hits", "misses", "expired", "evictions", "entries"} (모든 프로세스 누적)"""
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+            entries = conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+        result = {name: counters.get(name, 0) for name in ("hits", "misses", "expired", "evictions")}
+        result["entries"] = entries
+        return result
+
+    def clear(self):
+        """모든 항목과 카운터 삭제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM geocode")
+            conn.execute("DELETE FROM counters")
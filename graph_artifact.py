@@ -0,0 +1,121 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+import zlib
+
+import numpy as np
+
+from subway_routing import AVG_SPEED_KMH, SubwayGraph, load_subway_network
+
+# 아티팩트 형식 버전 (저장 항목이 바뀌면 올려서 이전 파일을 무효화)
+ARTIFACT_VERSION = 1
+
+
+def source_hash(subway_csv, location_csv, avg_speed_kmh=AVG_SPEED_KMH):
+    """원본 CSV 내용 + 평균 속도 + 형식 버전으로 아티팩트 키(sha256)를 만든다."""
+    h = hashlib.sha256()
+    h.update(f"v{ARTIFACT_VERSION}:{avg_speed_kmh}".encode())
+    for path in (subway_csv, location_csv):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def write_atomic(path, write):
+    """
+    path와 같은 디렉터리의 임시 파일에 write(f)로 기록한 뒤 os.replace로 바꿔 넣는다.
+    동시에 기동한 다른 프로세스는 이전 파일이나 완성된 파일만 보고, 쓰다 만 파일은 보지 않는다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.chmod(tmp_path, 0o644)  # mkstemp은 0600으로 만들므로 open()으로 쓰던 때와 같게
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_artifact(path, subwayLoc, graph, key):
+    """그래프(CSR 배열)와 역 좌표를 하나의 .npz 파일로 저장 (임시 파일 + 교체)"""
+    write_atomic(path, lambda f: _write_artifact(f, subwayLoc, graph, key))
+
+
+def _write_artifact(f, subwayLoc, graph, key):
+    loc_names = list(subwayLoc)
+    np.savez_compressed(
+        f,
+        version=np.int32(ARTIFACT_VERSION),
+        source_hash=np.array(key),
+        speed_kmh=np.float64(graph.speed_kmh),
+        heuristic_scale=np.float64(graph.heuristic_scale),
+        names=np.array(graph.names),
+        offsets=np.frombuffer(graph.offsets, dtype=np.int32),
+        targets=np.frombuffer(graph.targets, dtype=np.int32),
+        dist_km=np.frombuffer(graph.dist_km, dtype=np.float64),
+        time_min=np.frombuffer(graph.time_min, dtype=np.float64),
+        lat=np.frombuffer(graph.lat, dtype=np.float64),
+        lng=np.frombuffer(graph.lng, dtype=np.float64),
+        has_coord=np.frombuffer(bytes(graph.has_coord), dtype=np.uint8),
+        loc_names=np.array(loc_names),
+        loc_coords=np.array([subwayLoc[name] for name in loc_names], dtype=np.float64),
+    )
+
+
+def load_artifact(path, key):
+    """
+    아티팩트를 읽어 (subwayLoc, nodes, SubwayGraph)를 반환.
+    파일이 없거나 버전/해시가 다르거나, 잘리거나 깨져 읽을 수 없으면 None.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return _read_artifact(data, key)
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile, zlib.error):
+        return None
+
+
+def _read_artifact(data, key):
+    if int(data["version"]) != ARTIFACT_VERSION or str(data["source_hash"]) != key:
+        return None
+
+    graph = SubwayGraph.fromArrays(
+        data["names"].tolist(),
+        data["offsets"].tolist(),
+        data["targets"].tolist(),
+        data["dist_km"].tolist(),
+        data["time_min"].tolist(),
+        data["lat"].tolist(),
+        data["lng"].tolist(),
+        data["has_coord"].tobytes(),
+        float(data["heuristic_scale"]),
+        float(data["speed_kmh"]),
+    )
+    subwayLoc = {
+        name: coords
+        for name, coords in zip(data["loc_names"].tolist(), data["loc_coords"].tolist())
+    }
+    return subwayLoc, graph.nodes, graph
+
+
+def load_or_build(subway_csv, location_csv, artifact_path, avg_speed_kmh=AVG_SPEED_KMH):
+    """
+    원본 CSV 해시가 같으면 아티팩트를 한 번에 읽고,
+    다르면 CSV에서 그래프를 다시 만든 뒤 아티팩트를 갱신한다.
+    """
+    key = source_hash(subway_csv, location_csv, avg_speed_kmh)
+    loaded = load_artifact(artifact_path, key)
+    if loaded is not None:
+        return loaded
+
+    subwayLoc, nodes, graph = load_subway_network(subway_csv, location_csv, avg_speed_kmh)
+    try:
+        save_artifact(artifact_path, subwayLoc, graph, key)
+    except OSError:
+        pass  # 읽기 전용 배포 환경에서는 다음 기동 때도 CSV로 구성
+    return subwayLoc, nodes, graph
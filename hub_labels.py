@@ -0,0 +1,155 @@
+import heapq
+import time
+from array import array
+from bisect import bisect_left
+
+from contraction import ContractionHierarchy
+from subway_routing import INF
+
+
+def order_from_rank(rank):
+    """CH 축약 순서(rank)의 역순 = 중요한 노드부터의 허브 순서"""
+    return sorted(range(len(rank)), key=lambda i: -rank[i])
+
+
+# =========================
+# 2-hop 허브 라벨 (Pruned Landmark Labeling)
+# =========================
+class HubLabels:
+    """
+    역마다 (허브, 허브까지의 최단 시간) 라벨을 저장해, 두 역의 라벨에 공통으로 있는 허브 중
+    d(s, h) + d(h, t)가 가장 작은 값으로 s -> t 최단 시간을 구하는 거리 오라클.
+      - label_offsets[i] ~ label_offsets[i+1]: i번 노드의 라벨 구간
+      - label_hubs: 허브 순위(중요한 허브일수록 작은 값)로 정렬된 허브 번호
+      - label_dist: 허브까지의 시간(분), label_parent: 허브 쪽으로 한 칸 이동한 노드 (경로 복원용)
+    중요한 노드부터 가지치기 Dijkstra를 돌며, 이미 만든 라벨로 같거나 더 짧은 시간이 나오는
+    노드에서는 라벨을 추가하지 않고 탐색을 멈춘다 (그래프가 무방향이므로 라벨 하나로 양방향 사용).
+    """
+
+    def __init__(self, graph, order=None):
+        t0 = time.perf_counter()
+        self.graph = graph
+        n = graph.size
+        if order is None:
+            # 이미 만든 CH가 있으면 order_from_rank(ch.rank)를 넘겨 전처리를 한 번만 하게 한다
+            order = order_from_rank(ContractionHierarchy(graph).rank)
+        self.order = list(order)
+        self.hub_rank = array("i", [0]) * n  # 노드 -> 허브 순위
+        for r, v in enumerate(self.order):
+            self.hub_rank[v] = r
+
+        offsets, targets, weights = graph.offsets, graph.targets, graph.time_min
+        hubs = [[] for _ in range(n)]     # 노드별 허브 순위 목록 (추가 순서 = 정렬 순서)
+        dists = [[] for _ in range(n)]
+        parents = [[] for _ in range(n)]
+        # 현재 허브의 라벨을 펼쳐 둔 임시 배열 (가지치기 질의를 O(라벨 크기)로)
+        root_dist = [INF] * n
+
+        for r, root in enumerate(self.order):
+            for h, d in zip(hubs[root], dists[root]):
+                root_dist[h] = d
+            dist = {root: 0.0}
+            parent = {root: -1}
+            heap = [(0.0, root)]
+            done = set()
+            while heap:
+                du, u = heapq.heappop(heap)
+                if u in done:
+                    continue
+                done.add(u)
+                # 이미 있는 라벨로 root -> u를 du 이하로 잇는다면 가지치기
+                pruned = False
+                for h, d in zip(hubs[u], dists[u]):
+                    if root_dist[h] + d <= du:
+                        pruned = True
+                        break
+                if pruned:
+                    continue
+                hubs[u].append(r)
+                dists[u].append(du)
+                parents[u].append(parent[u])
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    nd = du + weights[k]
+                    if nd < dist.get(v, INF):
+                        dist[v] = nd
+                        parent[v] = u
+                        heapq.heappush(heap, (nd, v))
+            for h in hubs[root]:
+                root_dist[h] = INF
+
+        label_offsets = array("i", [0]) * (n + 1)
+        label_hubs = array("i")
+        label_dist = array("d")
+        label_parent = array("i")
+        for u in range(n):
+            label_hubs.extend(hubs[u])
+            label_dist.extend(dists[u])
+            label_parent.extend(parents[u])
+            label_offsets[u + 1] = len(label_hubs)
+
+        self.label_offsets = label_offsets
+        self.label_hubs = label_hubs
+        self.label_dist = label_dist
+        self.label_parent = label_parent
+        self.preprocess_s = time.perf_counter() - t0
+
+    def _meet(self, s, t):
+        """정렬된 두 라벨을 병합하며 (최단 시간, 허브 순위) 반환 (공통 허브가 없으면 (INF, -1))"""
+        offsets, hubs, dist = self.label_offsets, self.label_hubs, self.label_dist
+        i, i_end = offsets[s], offsets[s + 1]
+        j, j_end = offsets[t], offsets[t + 1]
+        best, best_hub = INF, -1
+        while i < i_end and j < j_end:
+            hi, hj = hubs[i], hubs[j]
+            if hi == hj:
+                d = dist[i] + dist[j]
+                if d < best:
+                    best, best_hub = d, hi
+                i += 1
+                j += 1
+            elif hi < hj:
+                i += 1
+            else:
+                j += 1
+        return best, best_hub
+
+    def costTo(self, start, end):
+        """start -> end 최단 시간(분), 도달 불가면 inf"""
+        index = self.graph.index
+        return self._meet(index[start], index[end])[0]
+
+    def _toHub(self, u, hub):
+        """u에서 허브까지 라벨의 parent를 따라간 노드 목록 (u 포함, 허브 노드 포함)"""
+        offsets, hubs, parent = self.label_offsets, self.label_hubs, self.label_parent
+        path = [u]
+        while True:
+            k = bisect_left(hubs, hub, offsets[u], offsets[u + 1])
+            u = parent[k]
+            if u < 0:
+                return path
+            path.append(u)
+
+    def pathTo(self, start, end):
+        """start -> end 역 이름 경로 (라벨의 parent로 허브까지 복원, 도달 불가면 [])"""
+        index = self.graph.index
+        s, t = index[start], index[end]
+        best, hub = self._meet(s, t)
+        if hub < 0:
+            return []
+        up = self._toHub(s, hub)
+        down = self._toHub(t, hub)
+        return self.graph.pathNames(up + down[-2::-1])
+
+    def labelSizes(self):
+        """역(노드 ID)별 라벨 크기"""
+        offsets = self.label_offsets
+        return {name: offsets[i + 1] - offsets[i] for i, name in enumerate(self.graph.names)}
+
+    @property
+    def index_bytes(self):
+        """라벨 배열 크기(바이트)"""
+        return sum(
+            arr.itemsize * len(arr)
+            for arr in (self.label_offsets, self.label_hubs, self.label_dist, self.label_parent)
+        )
@@ -0,0 +1,117 @@
+import zipfile
+import zlib
+
+import numpy as np
+
+from graph_artifact import write_atomic
+from subway_routing import Dijkstra
+
+# 기본 랜드마크 개수
+DEFAULT_LANDMARKS = 12
+
+# 랜드마크 파일 형식 버전 (저장 항목이 바뀌면 올려서 이전 파일을 무효화)
+LANDMARK_VERSION = 1
+
+
+# =========================
+# ALT (A*, Landmarks, Triangle inequality) 하한 인덱스
+# =========================
+class LandmarkIndex:
+    """
+    랜드마크 역 L마다 모든 역까지의 최단 소요 시간 d(L, v)를 저장한 인덱스.
+    삼각부등식에 의해 |d(L, t) - d(L, v)| <= d(v, t) 이므로,
+    랜드마크별 값의 최댓값이 v -> t 비용의 하한(A* 휴리스틱)이 된다.
+    그래프가 무방향이라 '랜드마크까지'와 '랜드마크에서' 거리가 같으므로 한 방향만 저장한다.
+    """
+
+    def __init__(self, graph, landmarks, dist):
+        self.graph = graph
+        self.landmarks = list(landmarks)  # 랜드마크 노드 인덱스
+        self.dist = np.asarray(dist, dtype=np.float64)  # (랜드마크 수, 역 수)
+
+    def boundsTo(self, t):
+        """t번 노드까지의 하한 목록 (인덱스 = 노드, 도달 불가 랜드마크 값은 무시)"""
+        to_t = self.dist[:, t:t + 1]
+        with np.errstate(invalid="ignore"):
+            diff = np.abs(to_t - self.dist)
+        # 랜드마크와 다른 연결 요소(inf)가 섞이면 하한을 0으로 둔다
+        diff[~np.isfinite(diff)] = 0.0
+        return diff.max(axis=0).tolist()
+
+
+def select_landmarks(graph, k=DEFAULT_LANDMARKS):
+    """
+    노선 종점(서로 다른 이웃이 하나뿐인 역)을 후보로 farthest-point 방식으로 k개를 고른다.
+      1) 가장 많이 연결된 환승역에서 가장 먼 종점을 첫 랜드마크로
+      2) 이후에는 이미 고른 랜드마크들과의 최소 거리가 가장 큰 후보를 추가
+    환승역에서 도달할 수 없는 후보(본선과 끊긴 구간)는 제외하고, 종점이 모자라면 전체 역을 후보로 쓴다.
+    반환: (랜드마크 노드 인덱스 목록, (k, 역 수) 거리 배열)
+    """
+    n = graph.size
+    offsets, targets = graph.offsets, graph.targets
+    degree = [len(set(targets[offsets[i]:offsets[i + 1]])) for i in range(n)]
+    hub = max(range(n), key=degree.__getitem__)
+
+    def distances_from(u):
+        dijkstra = Dijkstra(graph)
+        dijkstra.getTree(graph.names[u])
+        return np.array(dijkstra.dist)
+
+    from_hub = distances_from(hub)
+    reachable = np.isfinite(from_hub)
+    candidates = [i for i in range(n) if degree[i] == 1 and reachable[i]]
+    if len(candidates) < k:
+        candidates = [i for i in range(n) if reachable[i]]
+
+    chosen = [max(candidates, key=lambda i: from_hub[i])]
+    rows = [distances_from(chosen[0])]
+    nearest = rows[0].copy()  # 후보별 가장 가까운 랜드마크까지의 거리
+    while len(chosen) < min(k, len(candidates)):
+        nxt = max((i for i in candidates if i not in chosen), key=lambda i: nearest[i])
+        chosen.append(nxt)
+        rows.append(distances_from(nxt))
+        nearest = np.minimum(nearest, rows[-1])
+    return chosen, np.vstack(rows)
+
+
+def build_landmarks(graph, k=DEFAULT_LANDMARKS):
+    landmarks, dist = select_landmarks(graph, k)
+    return LandmarkIndex(graph, landmarks, dist)
+
+
+def save_landmarks(path, index, key):
+    """랜드마크 거리 배열을 그래프 아티팩트와 같은 원본 해시로 저장 (임시 파일 + 교체)"""
+    write_atomic(path, lambda f: np.savez_compressed(
+        f,
+        version=np.int32(LANDMARK_VERSION),
+        source_hash=np.array(key),
+        landmarks=np.array([index.graph.names[i] for i in index.landmarks]),
+        dist=index.dist,
+    ))
+
+
+def load_landmarks(path, graph, key):
+    """파일이 없거나 버전/해시가 다르거나, 잘리거나 깨져 읽을 수 없으면 None"""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != LANDMARK_VERSION or str(data["source_hash"]) != key:
+                return None
+            landmarks = [graph.index[name] for name in data["landmarks"].tolist()]
+            dist = data["dist"]
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile, zlib.error):
+        return None
+    return LandmarkIndex(graph, landmarks, dist)
+
+
+def load_or_build_landmarks(path, graph, key, k=DEFAULT_LANDMARKS):
+    """해시가 같으면 저장된 랜드마크를 읽고, 다르면 다시 골라 저장한다."""
+    index = load_landmarks(path, graph, key)
+    if index is not None:
+        return index
+
+    index = build_landmarks(graph, k)
+    try:
+        save_landmarks(path, index, key)
+    except OSError:
+        pass  # 읽기 전용 배포 환경에서는 다음 기동 때도 새로 계산
+    return index
@@ -0,0 +1,304 @@
+import heapq
+from functools import lru_cache
+
+import numpy as np
+
+from subway_routing import INF, TreeCache, multi_source_tree
+
+
+# =========================
+# 다중 인원 만남역 계산
+# =========================
+
+def cost_matrix(trees):
+    """
+    출발역별 비용 벡터를 역 인덱스(graph.names 순서)에 맞춰 쌓은 (인원 수, 역 수) 행렬.
+    도달 불가 역은 inf 그대로 두어 합산 시 자동으로 제외되게 한다.
+    (트리의 dist는 array('d') 또는 시간 행렬의 float32 행)
+    """
+    return np.vstack([np.asarray(tree.dist, dtype=np.float64) for tree in trees])
+
+
+# 만남역 선정 기준 (objective 키 -> 화면 표시 이름)
+OBJECTIVES = {
+    "sum": "총 소요시간 최소",
+    "max": "가장 오래 걸리는 사람 기준 최소",
+    "sum_std": "총 소요시간 + λ·표준편차 (공평성)",
+    "weighted": "가중 합 최소",
+}
+DEFAULT_LAMBDA = 1.0
+# 점수 비교 허용 오차: 이 안의 차이는 부동소수 합산 순서 차이로 보고 동점(인덱스가 작은 역 우선)으로 처리
+SCORE_TIE_TOL = 1e-9
+
+
+def group_start_stations(start_station_ids, weights=None):
+    """
+    같은 출발역을 하나로 묶는다 (대규모 모임에서는 출발역이 많이 겹침).
+    반환: (고유 출발역 목록, 출발역별 인원 수 배열, 출발역별 가중치 합 배열 또는 None)
+    """
+    position = {}
+    counts = []
+    summed = [] if weights is not None else None
+    for i, s in enumerate(start_station_ids):
+        j = position.get(s)
+        if j is None:
+            j = position[s] = len(counts)
+            counts.append(0)
+            if summed is not None:
+                summed.append(0.0)
+        counts[j] += 1
+        if summed is not None:
+            summed[j] += weights[i]
+    counts = np.asarray(counts, dtype=np.float64)
+    if summed is not None:
+        summed = np.asarray(summed, dtype=np.float64)
+    return list(position), counts, summed
+
+
+def score_candidates(matrix, objective="sum", lam=DEFAULT_LAMBDA, weights=None, counts=None):
+    """
+    (출발역 수, 역 수) 비용 행렬을 기준(objective)에 따라 역별 점수 벡터로 줄인다.
+      - sum: 총합, max: 최댓값(minimax), sum_std: 총합 + lam * 표준편차,
+      - weighted: 행별 weights를 곱한 합
+    counts가 주어지면 각 행을 그 인원 수만큼의 사람으로 보고 집계한다.
+    도달 불가(inf)가 하나라도 있는 역은 inf 점수가 된다.
+    """
+    if counts is None:
+        counts = np.ones(matrix.shape[0])
+    if objective == "sum":
+        return counts @ matrix
+    if objective == "max":
+        return matrix.max(axis=0)
+    if objective == "sum_std":
+        total = counts @ matrix
+        with np.errstate(invalid="ignore"):
+            mean = total / counts.sum()
+            spread = np.sqrt(counts @ (matrix - mean) ** 2 / counts.sum())
+        scores = total + lam * spread
+        scores[~np.isfinite(scores)] = np.inf
+        return scores
+    if objective == "weighted":
+        if weights is None or len(weights) != matrix.shape[0]:
+            raise ValueError("weighted 기준에는 사람 수만큼의 가중치가 필요합니다.")
+        scores = np.asarray(weights, dtype=np.float64) @ matrix
+        scores[np.isnan(scores)] = np.inf  # 가중치 0 * inf
+        return scores
+    raise ValueError(f"알 수 없는 만남역 기준: {objective}")
+
+
+def best_meeting_station(all_costs, start_station_ids, names,
+                         objective="sum", lam=DEFAULT_LAMBDA, weights=None):
+    """
+    이미 계산된 출발역별 ShortestPathTree(all_costs)만으로 기준별 최적 만남역을 고른다.
+    기준을 바꿔도 최단 경로 탐색을 다시 하지 않는다.
+    같은 출발역은 한 행으로 묶어 인원 수(가중치 합)만큼 반영한다.
+    반환: (만남역, 점수, 역별 점수 벡터)
+    """
+    if objective == "weighted" and (weights is None or len(weights) != len(start_station_ids)):
+        raise ValueError("weighted 기준에는 사람 수만큼의 가중치가 필요합니다.")
+    starts, counts, summed = group_start_stations(start_station_ids, weights)
+    matrix = cost_matrix([all_costs[s] for s in starts])
+    scores = score_candidates(matrix, objective, lam, summed, counts)
+
+    best_score = scores.min() if len(scores) else np.inf
+    if not np.isfinite(best_score):
+        return None, float("inf"), scores
+    # 허용 오차 안의 동점은 인덱스가 작은 역 (가지치기 탐색과 같은 규칙)
+    best = int(np.flatnonzero(scores <= best_score + SCORE_TIE_TOL)[0])
+    return names[best], float(scores[best]), scores
+
+
+@lru_cache(maxsize=4)
+def station_groups(graph):
+    """
+    호선별 노드(예: 잠실(2), 잠실(8))를 물리적 역 이름(잠실) 하나로 묶는다.
+    반환: (역 이름 목록, 노드별 역 번호 배열, 역 번호별 노드 인덱스 목록)
+    """
+    group_names = []
+    group_index = {}
+    group_of = np.empty(graph.size, dtype=np.int32)
+    members = []
+    for i, name in enumerate(graph.names):
+        # 괄호 앞까지만 역 이름 추출 (예: "기흥(백남준아트센터)(B)" -> "기흥")
+        base = name.split("(")[0]
+        g = group_index.get(base)
+        if g is None:
+            g = group_index[base] = len(group_names)
+            group_names.append(base)
+            members.append([])
+        group_of[i] = g
+        members[g].append(i)
+    return group_names, group_of, members
+
+
+def top_k_meeting_stations(scores, graph, k=5):
+    """
+    역별 점수 벡터에서 물리적 역 기준 상위 k개 후보를 고른다.
+    같은 역의 호선별 노드는 가장 점수가 좋은 노드 하나로 합치고,
+    전체 정렬 대신 argpartition으로 k개만 골라 정렬한다 (O(n + k log k)).
+    반환: [{"name": 역 이름, "station": 노드 ID, "score": 점수}, ...] (점수 오름차순)
+    """
+    group_names, group_of, members = station_groups(graph)
+    group_scores = np.full(len(group_names), np.inf)
+    np.minimum.at(group_scores, group_of, scores)
+
+    finite = np.flatnonzero(np.isfinite(group_scores))
+    k = min(k, len(finite))
+    if k == 0:
+        return []
+    top = finite[np.argpartition(group_scores[finite], k - 1)[:k]]
+    top = top[np.argsort(group_scores[top], kind="stable")]
+
+    results = []
+    for g in top:
+        node = min(members[g], key=lambda i: scores[i])
+        results.append({
+            "name": group_names[g],
+            "station": graph.names[node],
+            "score": float(group_scores[g]),
+        })
+    return results
+
+
+def find_best_meeting_station(start_station_ids, tree_cache: TreeCache,
+                              objective="sum", lam=DEFAULT_LAMBDA, weights=None, origins=None):
+    """
+    여러 출발역(start_station_ids)에서 출발할 때
+    기준(objective, 기본은 총 소요 시간)이 최소가 되는 만남역을 찾는다.
+    출발역별 트리는 고유 출발역마다 한 번만 구한다.
+    origins({출발지: {노드ID: 도보 시간(분)}})에 있는 출발지는 주변 역 여러 곳에서
+    한 번의 다중 출발 탐색으로 트리를 만든다 (도보 시간 포함, 캐시하지 않음).
+    반환: (만남역, 점수, 출발역별 ShortestPathTree, 역별 점수 벡터)
+    """
+    origins = origins or {}
+    all_costs = tree_cache.getMany([s for s in start_station_ids if s not in origins])
+    for key in dict.fromkeys(s for s in start_station_ids if s in origins):
+        all_costs[key] = multi_source_tree(tree_cache.graph, origins[key])
+
+    best_station, best_score, scores = best_meeting_station(
+        all_costs, start_station_ids, tree_cache.graph.names, objective, lam, weights
+    )
+    return best_station, best_score, all_costs, scores
+
+
+def find_best_meeting_station_pruned(start_station_ids, graph, objective="sum", weights=None):
+    """
+    출발역별 탐색을 동시에(가장 반경이 작은 탐색부터) 한 단계씩 키우다가,
+    모든 탐색이 확정한 후보의 점수를 아직 확정되지 않은 어떤 역도 이길 수 없으면 멈춘다.
+    (threshold algorithm 방식, 전체 탐색 후 점수를 매기는 find_best_meeting_station과 같은 답)
+      - 확정되지 않은 역의 하한: 각 탐색에서 확정했으면 그 비용, 아니면 그 탐색의 현재 반경
+      - 합산 순서가 달라 생기는 오차(SCORE_TIE_TOL 이내)는 동점으로 보고 인덱스가 작은 역을 고른다
+    objective는 단조 집계인 sum / max / weighted 만 지원한다.
+    최적 역 하나와 그 경로만 구하므로 라이브러리/배치용이다. 만남역 탭은 상위 k개 후보와
+    기준 변경 시 재계산을 위해 역별 점수 벡터 전체가 필요하고, 앱의 TreeCache에는 시간 행렬이
+    연결돼 있어 출발역별 비용이 탐색 없이 행렬 조회로 나오므로 이 함수를 쓰지 않는다.
+    반환: (만남역, 점수, 출발역별 경로, 전체 확정 노드 수)
+    """
+    if objective not in ("sum", "max", "weighted"):
+        raise ValueError(f"가지치기 탐색이 지원하지 않는 기준: {objective}")
+    if objective == "weighted" and (weights is None or len(weights) != len(start_station_ids)):
+        raise ValueError("weighted 기준에는 사람 수만큼의 가중치가 필요합니다.")
+
+    # 같은 출발역은 한 번만 탐색 (sum/weighted는 가중치를 합산)
+    starts = []
+    factor = {}
+    for i, s in enumerate(start_station_ids):
+        w = weights[i] if objective == "weighted" else 1.0
+        if s not in factor:
+            starts.append(s)
+            factor[s] = 0.0
+        factor[s] = max(factor[s], w) if objective == "max" else factor[s] + w
+    coef = [factor[s] for s in starts]
+
+    def aggregate(values):
+        if objective == "max":
+            return max(values)
+        total = 0.0
+        for c, v in zip(coef, values):
+            total += c * v
+        return total
+
+    n = graph.size
+    m = len(starts)
+    offsets, targets, weights_arr = graph.offsets, graph.targets, graph.time_min
+    dist = [[INF] * n for _ in range(m)]
+    parent = [[-1] * n for _ in range(m)]
+    visited = [bytearray(n) for _ in range(m)]
+    heaps = []
+    for j, s in enumerate(starts):
+        src = graph.index[s]
+        dist[j][src] = 0
+        heaps.append([(0, src)])
+
+    settled_by = [0] * n   # 노드별로 확정한 탐색 수
+    partial = []           # 일부 탐색만 확정한 노드의 (하한, 노드) 힙 (하한은 늦게 갱신)
+    best_node = -1
+    best_score = INF
+    settled = 0
+
+    def radius(j):
+        # j번 탐색의 현재 반경 (확정되지 않은 노드 비용의 하한)
+        heap = heaps[j]
+        while heap and visited[j][heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else INF
+
+    def partial_bound_exceeds(radii):
+        # 일부만 확정된 노드의 하한은 줄어들지 않으므로, 힙 맨 위부터 다시 계산해 올려 보낸다
+        while partial:
+            bound, v = partial[0]
+            if settled_by[v] == m:
+                heapq.heappop(partial)
+                continue
+            if bound > best_score + SCORE_TIE_TOL:
+                return True
+            fresh = aggregate([dist[j][v] if visited[j][v] else radii[j] for j in range(m)])
+            if fresh <= best_score + SCORE_TIE_TOL:
+                return False
+            heapq.heapreplace(partial, (fresh, v))
+        return True
+
+    radii = [0.0] * m
+    while True:
+        # 어떤 탐색도 확정하지 않은 역의 하한 = 반경들의 집계
+        if (best_node >= 0 and aggregate(radii) > best_score + SCORE_TIE_TOL
+                and partial_bound_exceeds(radii)):
+            break
+        j = min(range(m), key=radii.__getitem__)
+        if radii[j] == INF:
+            break  # 모든 탐색이 도달 가능한 역을 전부 확정
+
+        du, u = heapq.heappop(heaps[j])
+        visited[j][u] = 1
+        settled += 1
+        settled_by[u] += 1
+        if settled_by[u] == m:
+            score = aggregate([dist[k][u] for k in range(m)])
+            # 허용 오차 안의 동점이면 인덱스가 작은 역 (전체 탐색과 같은 규칙)
+            if (score < best_score - SCORE_TIE_TOL
+                    or (score <= best_score + SCORE_TIE_TOL and u < best_node)):
+                best_score = score
+                best_node = u
+        elif settled_by[u] == 1:
+            heapq.heappush(partial, (0, u))
+
+        dj, pj = dist[j], parent[j]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = du + weights_arr[k]
+            if nd < dj[v]:
+                dj[v] = nd
+                pj[v] = u
+                heapq.heappush(heaps[j], (nd, v))
+        radii[j] = radius(j)  # 다른 탐색의 반경은 그대로
+
+    if best_node < 0:
+        return None, INF, {}, settled
+
+    paths = {}
+    for j, s in enumerate(starts):
+        path = [best_node]
+        while parent[j][path[-1]] >= 0:
+            path.append(parent[j][path[-1]])
+        paths[s] = graph.pathNames(path[::-1])
+    return graph.names[best_node], best_score, paths, settled
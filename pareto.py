@@ -0,0 +1,94 @@
+import heapq
+from array import array
+from functools import lru_cache
+
+from subway_routing import get_path_distance_and_time
+
+# 이 차이(분) 이내의 소요 시간은 같은 시간으로 본다 (거리 합산 순서에 따른 부동소수 오차)
+TIME_EPS = 1e-6
+
+
+def station_base(name):
+    """환승 판별용 역 이름 (merge_subway_files.py와 같은 정규화: 첫 괄호 앞, '역'/공백/'·' 제거)"""
+    return name.split("(")[0].replace("역", "").replace(" ", "").replace("·", "").strip()
+
+
+def station_line(name):
+    """노드 ID의 호선 (마지막 괄호 안, 예: "기흥(백남준아트센터)(B)" -> "B")"""
+    if "(" in name and ")" in name:
+        return name.split("(")[-1].replace(")", "")
+    return ""
+
+
+@lru_cache(maxsize=4)
+def transfer_flags(graph):
+    """
+    CSR 간선별 환승 여부 (1: 같은 역 이름의 다른 호선을 잇는 환승 간선).
+    merge_subway_files.py가 만드는 0.3 km 환승 간선과 같은 규칙으로 판별한다.
+    """
+    base = [station_base(name) for name in graph.names]
+    line = [station_line(name) for name in graph.names]
+    flags = bytearray(len(graph.targets))
+    for u in range(graph.size):
+        for k in range(graph.offsets[u], graph.offsets[u + 1]):
+            v = graph.targets[k]
+            if base[u] == base[v] and line[u] != line[v]:
+                flags[k] = 1
+    return flags
+
+
+def pareto_routes(graph, start, end, max_transfers=None):
+    """
+    (소요 시간, 환승 횟수) 두 기준의 파레토 최적 경로를 모두 구하는 label-setting 탐색.
+    라벨을 (시간, 환승) 사전식 순서로 꺼내므로, 어떤 노드에서 새로 확정되는 라벨은
+    그 노드에서 이미 확정된 라벨보다 시간이 같거나 길다. 따라서 환승 횟수가 더 적을 때만
+    지배되지 않으며, 노드별로 '확정된 최소 환승 횟수' 하나만 비교하면 된다.
+    도착역에서 확정된 라벨보다 환승이 적지 않은 라벨도 지배되므로 바로 버린다.
+    반환: [{"time", "transfers", "distance", "path"}, ...] (시간 오름차순 = 환승 내림차순)
+    """
+    s, t = graph.index[start], graph.index[end]
+    offsets, targets, weights = graph.offsets, graph.targets, graph.time_min
+    flags = transfer_flags(graph)
+    limit = (max_transfers + 1) if max_transfers is not None else len(graph.names)
+
+    # best_x[v]: v에서 확정된 라벨의 최소 환승 횟수 (없으면 limit)
+    best_x = array("i", [limit]) * graph.size
+    # 라벨 저장소: 노드, 부모 라벨 번호
+    lab_node = array("i", [s])
+    lab_parent = array("i", [-1])
+    heap = [(0.0, 0, 0)]  # (시간, 환승, 라벨 번호)
+    front = []
+
+    while heap:
+        du, xu, label = heapq.heappop(heap)
+        u = lab_node[label]
+        if xu >= best_x[u] or xu >= best_x[t]:
+            continue  # 지배된 라벨
+        best_x[u] = xu
+        if u == t:
+            if front and du - front[-1][0] <= TIME_EPS:
+                front.pop()  # 사실상 같은 시간인데 환승이 더 많은 라벨은 지배됨
+            front.append((du, xu, label))
+            if xu == 0:
+                break  # 환승 0회보다 나은 라벨은 없음
+            continue
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            xv = xu + flags[k]
+            if xv >= best_x[v] or xv >= best_x[t]:
+                continue
+            lab_node.append(v)
+            lab_parent.append(label)
+            heapq.heappush(heap, (du + weights[k], xv, len(lab_node) - 1))
+
+    routes = []
+    for du, xu, label in front:
+        path = []
+        while label >= 0:
+            path.append(lab_node[label])
+            label = lab_parent[label]
+        names = graph.pathNames(path[::-1])
+        dist, _ = get_path_distance_and_time(names, graph)
+        routes.append({"time": du, "transfers": xu, "distance": dist, "path": names})
+    return routes
@@ -0,0 +1,281 @@
+import csv
+import math
+import time
+
+from pareto import station_line, transfer_flags
+from subway_routing import INF
+
+# 환승 통로 이동 + 승강장 대기 여유 (분)
+DEFAULT_TRANSFER_MIN = 3.0
+# 최대 라운드 수 (라운드 k = 열차 k번 탑승)
+DEFAULT_MAX_ROUNDS = 8
+# 시간표 CSV에 없는 호선에 쓰는 운행 패턴 (첫차, 막차, 배차 간격(분))
+DEFAULT_SERVICE = (5 * 60 + 30, 24 * 60, 10.0)
+
+
+def parse_clock(text):
+    """ "HH:MM" -> 자정 기준 분 (막차처럼 24시 이후는 "24:30"으로 표기) """
+    hours, minutes = text.strip().split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def format_clock(minutes):
+    """자정 기준 분 -> "HH:MM" (초 단위는 올림, 24시 이후는 다음 날 시각으로)"""
+    total = int(math.ceil(minutes - 1e-9)) % (24 * 60)
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+def load_line_schedule(path):
+    """
+    호선별 운행 패턴 CSV 로드 (열: line, name, first_train, last_train, headway_min)
+    반환: {호선: (첫차(분), 막차(분), 배차 간격(분))}
+    """
+    schedule = {}
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            first = parse_clock(row["first_train"])
+            last = parse_clock(row["last_train"])
+            headway = float(row["headway_min"])
+            if headway <= 0 or last < first:
+                raise ValueError(f"잘못된 운행 패턴: {row['line']}")
+            schedule[row["line"].strip()] = (first, last, headway)
+    return schedule
+
+
+# =========================
+# 노선(route) 분해
+# =========================
+def line_routes(graph, flags):
+    """
+    호선별로 환승 간선을 뺀 부분 그래프를 종점/분기역(이웃 수가 2가 아닌 역) 사이의
+    최대 구간으로 나눈다. 분기가 없는 순환선은 한 바퀴를 한 구간으로 본다.
+    반환: [(호선, [노드 인덱스, ...]), ...] (한 방향만, 역방향은 호출하는 쪽에서 추가)
+    """
+    offsets, targets = graph.offsets, graph.targets
+    lines = [station_line(name) for name in graph.names]
+    adj = [[] for _ in range(graph.size)]
+    for u in range(graph.size):
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if not flags[k] and v not in adj[u]:
+                adj[u].append(v)
+
+    used = set()
+
+    def walk(a, b):
+        # a -> b 방향으로 다음 종점/분기역(또는 a로 돌아올 때)까지 진행
+        seq = [a, b]
+        used.add((a, b))
+        used.add((b, a))
+        prev, cur = a, b
+        while len(adj[cur]) == 2 and cur != a:
+            nxt = adj[cur][0] if adj[cur][1] == prev else adj[cur][1]
+            used.add((cur, nxt))
+            used.add((nxt, cur))
+            seq.append(nxt)
+            prev, cur = cur, nxt
+        return seq
+
+    routes = []
+    for u in range(graph.size):
+        if len(adj[u]) != 2:
+            for v in adj[u]:
+                if (u, v) not in used:
+                    routes.append((lines[u], walk(u, v)))
+    # 남은 간선은 분기 없는 순환선
+    for u in range(graph.size):
+        for v in adj[u]:
+            if (u, v) not in used:
+                routes.append((lines[u], walk(u, v)))
+    return routes
+
+
+# =========================
+# RAPTOR (라운드 기반 대중교통 탐색)
+# =========================
+class RaptorEngine:
+    """
+    호선별 배차 간격 시간표 위에서 출발 시각 기준 최단 도착 시각을 구하는 RAPTOR 엔진.
+      - route_stops[r]: r번 노선(한 방향)의 정차역 순서, route_offsets[r]: 첫 역 출발 후 각 역 도착까지 분
+      - route_service[r]: (첫차, 막차, 배차 간격) — 첫 역 출발 시각이 첫차 + i * 배차 간격(막차 이하)
+      - routes_at[p]: p번 역을 지나는 (노선, 정차 순번) 목록
+      - footpaths[p]: 같은 역 다른 호선(환승 간선) 목록, 이동에 transfer_min분
+    우선순위 큐 대신 라운드마다 갱신된 역을 지나는 노선만 배열 순서대로 훑는다.
+    만든 뒤에는 바뀌지 않으므로 여러 질의(스레드)에서 함께 써도 된다.
+    """
+
+    def __init__(self, graph, schedule, transfer_min=DEFAULT_TRANSFER_MIN):
+        t0 = time.perf_counter()
+        self.graph = graph
+        self.transfer_min = transfer_min
+        flags = transfer_flags(graph)
+
+        self.route_line = []
+        self.route_stops = []
+        self.route_offsets = []
+        self.route_service = []
+        for line, stops in line_routes(graph, flags):
+            times = [0.0]
+            for a, b in zip(stops, stops[1:]):
+                times.append(times[-1] + graph.time_min[graph.edgeBetween(a, b)])
+            service = schedule.get(line, DEFAULT_SERVICE)
+            # 정방향/역방향을 별도 노선으로
+            for seq, offs in ((stops, times), (stops[::-1], [times[-1] - x for x in times[::-1]])):
+                self.route_line.append(line)
+                self.route_stops.append(seq)
+                self.route_offsets.append(offs)
+                self.route_service.append(service)
+
+        self.routes_at = [[] for _ in range(graph.size)]
+        for r, stops in enumerate(self.route_stops):
+            for i, p in enumerate(stops):
+                self.routes_at[p].append((r, i))
+
+        self.footpaths = [[] for _ in range(graph.size)]
+        for u in range(graph.size):
+            for k in range(graph.offsets[u], graph.offsets[u + 1]):
+                v = graph.targets[k]
+                if flags[k] and v not in self.footpaths[u]:
+                    self.footpaths[u].append(v)
+        self.preprocess_s = time.perf_counter() - t0
+
+    @property
+    def num_routes(self):
+        return len(self.route_stops)
+
+    def nextDeparture(self, r, earliest):
+        """r번 노선에서 첫 역 출발 시각이 earliest 이상인 가장 이른 열차 (없으면 None)"""
+        first, last, headway = self.route_service[r]
+        if earliest <= first:
+            return first
+        dep = first + math.ceil((earliest - first) / headway - 1e-9) * headway
+        return dep if dep <= last else None
+
+    def _relaxFootpaths(self, tau, best, labels, marked, t):
+        """
+        이번 라운드에 갱신된 역에서 환승 통로로 이동 (marked를 제자리에서 늘린다).
+        환승 간선이 추이적이지 않은 역(예: 기흥(B) - 기흥(E) - 기흥(백남준아트센터)(B))도
+        있으므로, 환승으로 새로 갱신된 역에서도 다시 이동한다.
+        """
+        stack = list(marked)
+        while stack:
+            p = stack.pop()
+            arr = tau[p] + self.transfer_min
+            for v in self.footpaths[p]:
+                if arr < best[v] and arr < best[t]:
+                    tau[v] = best[v] = arr
+                    labels[v] = ("walk", p)
+                    marked.add(v)
+                    stack.append(v)
+
+    def query(self, start, end, depart, max_rounds=DEFAULT_MAX_ROUNDS):
+        """
+        depart(자정 기준 분)에 start를 출발해 end에 도착하는 여정을 라운드별로 구한다.
+        라운드 k에서 도착 시각이 앞 라운드보다 빨라질 때만 여정을 남기므로,
+        반환 목록은 (탑승 횟수, 도착 시각) 기준 파레토 최적이다.
+        반환: [{"rides", "transfers", "depart", "arrival", "duration", "legs", "path"}, ...]
+              (탑승 횟수 오름차순 = 도착 시각 내림차순, 도달 불가면 [])
+        transfers는 환승 통로 이동(walk 구간) 횟수로, 파레토 경로의 환승 간선 수와 같은 기준이다
+        (도착역 다른 호선 승강장으로 걸어가는 이동도 포함, 분기역에서 같은 호선을 갈아타는 것은 제외).
+        """
+        index = self.graph.index
+        s, t = index[start], index[end]
+        n = self.graph.size
+        stops_of, offsets_of = self.route_stops, self.route_offsets
+        routes_at = self.routes_at
+
+        # tau[k][p]: 열차 k번 이하로 p에 도착하는 가장 이른 시각, best[p]: 전체 라운드 최솟값
+        tau = [[INF] * n]
+        best = [INF] * n
+        # labels[k][p]: 라운드 k에 p가 갱신된 방법 ("ride", 노선, 탑승 순번, 하차 순번, 첫 역 출발) / ("walk", 출발역)
+        labels = [{s: ("origin",)}]
+        tau[0][s] = best[s] = depart
+        marked = {s}
+        self._relaxFootpaths(tau[0], best, labels[0], marked, t)
+
+        for k in range(1, max_rounds + 1):
+            prev_tau = tau[-1]
+            cur_tau = list(prev_tau)
+            cur_labels = {}
+            tau.append(cur_tau)
+            labels.append(cur_labels)
+
+            # 갱신된 역을 지나는 노선마다 가장 앞쪽 정차 순번부터 훑는다
+            queue = {}
+            for p in marked:
+                for r, i in routes_at[p]:
+                    if i < queue.get(r, len(stops_of[r])):
+                        queue[r] = i
+            marked = set()
+
+            for r, i0 in queue.items():
+                stops, offs = stops_of[r], offsets_of[r]
+                trip = None  # 현재 타고 있는 열차의 첫 역 출발 시각
+                board = -1
+                for i in range(i0, len(stops)):
+                    p = stops[i]
+                    if trip is not None:
+                        arr = trip + offs[i]
+                        if arr < best[p] and arr < best[t]:
+                            cur_tau[p] = best[p] = arr
+                            cur_labels[p] = ("ride", r, board, i, trip)
+                            marked.add(p)
+                    ready = prev_tau[p]
+                    if ready < INF and (trip is None or ready <= trip + offs[i]):
+                        dep = self.nextDeparture(r, ready - offs[i])
+                        if dep is not None and (trip is None or dep < trip):
+                            trip, board = dep, i
+
+            self._relaxFootpaths(cur_tau, best, cur_labels, marked, t)
+            if not marked:
+                break
+
+        journeys = []
+        for k in range(len(labels)):
+            if t in labels[k]:
+                journeys.append(self._journey(labels, k, s, t, depart))
+        return journeys
+
+    def _journey(self, labels, k, s, t, depart):
+        """라운드 k의 t 라벨에서 거꾸로 따라가 여정(구간 목록)을 복원"""
+        names = self.graph.names
+        legs = []
+        cur = t
+        while True:
+            while cur not in labels[k]:
+                k -= 1
+            label = labels[k][cur]
+            if label[0] == "origin":
+                break
+            if label[0] == "walk":
+                prev = label[1]
+                legs.append({"type": "walk", "from": names[prev], "to": names[cur],
+                             "depart": None, "arrive": None})
+                cur = prev
+            else:
+                _, r, board, alight, trip = label
+                stops, offs = self.route_stops[r], self.route_offsets[r]
+                legs.append({"type": "ride", "line": self.route_line[r],
+                             "from": names[stops[board]], "to": names[stops[alight]],
+                             "depart": trip + offs[board], "arrive": trip + offs[alight],
+                             "stops": [names[p] for p in stops[board:alight + 1]]})
+                cur = stops[board]
+                k -= 1
+        legs.reverse()
+
+        # 환승 이동 시각은 앞 구간 도착 시각부터 채운다
+        clock = depart
+        path = [names[s]]
+        for leg in legs:
+            if leg["type"] == "walk":
+                leg["depart"] = clock
+                leg["arrive"] = clock = clock + self.transfer_min
+                path.append(leg["to"])
+            else:
+                clock = leg["arrive"]
+                path.extend(leg["stops"][1:])
+
+        rides = sum(1 for leg in legs if leg["type"] == "ride")
+        transfers = sum(1 for leg in legs if leg["type"] == "walk")
+        return {"rides": rides, "transfers": transfers, "depart": depart,
+                "arrival": clock, "duration": clock - depart, "legs": legs, "path": path}
@@ -0,0 +1,142 @@
+import heapq
+import math
+from array import array
+
+from subway_routing import EARTH_RADIUS_KM
+
+# 역까지 걷는 속도 (직선거리 기준이라 보수적으로 느리게)
+WALK_SPEED_KMH = 4.0
+# 장소 하나를 이어 붙일 주변 역 개수와 최대 도보 거리
+SNAP_K = 3
+SNAP_RADIUS_KM = 1.5
+
+
+def _unit_vector(lat, lng):
+    """위경도 -> 단위 구 위의 3차원 좌표 (두 점의 직선(현) 거리는 대원 거리와 단조 관계)"""
+    p = math.radians(lat)
+    l = math.radians(lng)
+    return math.cos(p) * math.cos(l), math.cos(p) * math.sin(l), math.sin(p)
+
+
+def _chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+def _km_to_chord(km):
+    return 2 * math.sin(min(km / (2 * EARTH_RADIUS_KM), math.pi / 2))
+
+
+# =========================
+# 역 좌표 KD-tree (최근접 k개 / 반경 질의)
+# =========================
+class StationIndex:
+    """
+    subwayLoc(역 이름 -> [위도, 경도])의 좌표를 단위 구 위 3차원 점으로 바꿔 만든 KD-tree.
+    3차원 직선 거리가 대원 거리와 단조 관계이므로 가지치기는 직선 거리로 하고,
+    결과 거리만 하버사인(대원) 거리(km)로 바꿔 돌려준다 (위경도 '도' 단위 거리의 동서 왜곡 없음).
+    트리는 배열에 암묵적으로 저장한다: 구간 [lo, hi)의 중앙 mid가 분할 노드, 축은 깊이 % 3.
+    """
+
+    def __init__(self, subwayLoc):
+        items = sorted(subwayLoc.items())
+        points = [(_unit_vector(lat, lng), name) for name, (lat, lng) in items]
+        self._build(points)
+        self.names = [name for _, name in points]
+        self.xs = array("d", (p[0] for p, _ in points))
+        self.ys = array("d", (p[1] for p, _ in points))
+        self.zs = array("d", (p[2] for p, _ in points))
+
+    @staticmethod
+    def _build(points):
+        # 구간을 축 기준으로 정렬해 중앙값을 mid에 두고 양쪽을 나눠 반복 (제자리 정렬)
+        stack = [(0, len(points), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= 1:
+                continue
+            axis = depth % 3
+            points[lo:hi] = sorted(points[lo:hi], key=lambda item: item[0][axis])
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, depth + 1))
+            stack.append((mid + 1, hi, depth + 1))
+
+    def __len__(self):
+        return len(self.names)
+
+    def _search(self, q, radius2, visit):
+        """
+        q에서 직선 거리 제곱이 radius2() 이하일 수 있는 노드만 방문한다.
+        radius2는 함수라서 k-최근접 질의처럼 탐색 중 줄어드는 반경도 쓸 수 있다.
+        """
+        coords = (self.xs, self.ys, self.zs)
+        stack = [(0, len(self.names), 0, 0.0)]  # (구간, 깊이, 분할면까지 거리 제곱)
+        while stack:
+            lo, hi, depth, bound2 = stack.pop()
+            # 꺼낼 때 다시 확인 (가까운 쪽을 탐색하는 동안 반경이 줄었을 수 있음)
+            if lo >= hi or bound2 > radius2():
+                continue
+            mid = (lo + hi) // 2
+            dx = self.xs[mid] - q[0]
+            dy = self.ys[mid] - q[1]
+            dz = self.zs[mid] - q[2]
+            visit(mid, dx * dx + dy * dy + dz * dz)
+            axis = depth % 3
+            diff = q[axis] - coords[axis][mid]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            # 가까운 쪽을 먼저 꺼내도록 나중에 push
+            stack.append((far[0], far[1], depth + 1, max(bound2, diff * diff)))
+            stack.append((near[0], near[1], depth + 1, bound2))
+
+    def nearest(self, lat, lng, k=1):
+        """(lat, lng)에서 가까운 역 k개 [(역 이름, 거리(km)), ...] (가까운 순)"""
+        q = _unit_vector(lat, lng)
+        heap = []  # (-거리 제곱, 순번) 최대 힙
+
+        def visit(i, d2):
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, i))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, i))
+
+        def radius2():
+            return -heap[0][0] if len(heap) >= k else math.inf
+
+        if k > 0:
+            self._search(q, radius2, visit)
+        found = sorted((-d2, self.names[i]) for d2, i in heap)
+        return [(name, _chord_to_km(math.sqrt(d2))) for d2, name in found]
+
+    def within(self, lat, lng, radius_km):
+        """(lat, lng)에서 radius_km 이내의 역 [(역 이름, 거리(km)), ...] (가까운 순)"""
+        q = _unit_vector(lat, lng)
+        limit = _km_to_chord(radius_km) ** 2
+        found = []
+
+        def visit(i, d2):
+            if d2 <= limit:
+                found.append((d2, self.names[i]))
+
+        self._search(q, lambda: limit, visit)
+        found.sort()
+        return [(name, _chord_to_km(math.sqrt(d2))) for d2, name in found]
+
+
+def walk_minutes(km):
+    """직선 도보 거리(km) -> 도보 시간(분)"""
+    return km * 60.0 / WALK_SPEED_KMH
+
+
+def snap_to_stations(station_index, name_index, lat, lng, k=SNAP_K, radius_km=SNAP_RADIUS_KM):
+    """
+    장소 좌표를 가까운 역 k곳(radius_km 이내, 가장 가까운 역은 반경 밖이어도 포함)의
+    모든 호선 노드에 도보 시간을 붙여 이어 준다. 다중 출발/도착 탐색의 시작 비용으로 쓴다.
+    name_index: station_names.StationNameIndex (역 이름 -> 호선별 노드ID)
+    반환: {노드ID: 도보 시간(분)}
+    """
+    seeds = {}
+    for rank, (name, km) in enumerate(station_index.nearest(lat, lng, k)):
+        if rank > 0 and km > radius_km:
+            break
+        for node in name_index.lookup(name):
+            seeds.setdefault(node, walk_minutes(km))
+    return seeds
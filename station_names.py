@@ -0,0 +1,63 @@
+def normalize_station_name(name: str) -> str:
+    """
+    역 이름 비교용: 괄호 앞까지만, 공백 제거, 끝의 '역' 제거
+    (예: "홍대입구(2)" -> "홍대입구", "서울역" -> "서울", "역삼역" -> "역삼")
+    """
+    if not name:
+        return ""
+    base = name.split("(")[0].replace(" ", "").strip()
+    if len(base) > 1 and base.endswith("역"):
+        base = base[:-1]
+    return base
+
+
+def split_node_name(name):
+    """노드ID -> (역 이름, 부역명 목록, 호선) (예: "기흥(백남준아트센터)(B)" -> ("기흥", ["백남준아트센터"], "B"))"""
+    parts = [part.rstrip(")") for part in name.split("(")]
+    if len(parts) == 1:
+        return parts[0], [], ""
+    return parts[0], parts[1:-1], parts[-1]
+
+
+# =========================
+# 역 이름 -> 노드ID 색인
+# =========================
+class StationNameIndex:
+    """
+    정규화한 역 이름을 그 역의 모든 호선 노드ID로 바꾸는 사전 (로드 시 한 번 구성).
+      - 역 이름: "잠실" -> ["잠실(2)", "잠실(8)"]
+      - 부역명 별칭: "백남준아트센터" -> ["기흥(백남준아트센터)(B)"]
+    노드ID는 이름순으로 저장하므로 같은 입력에는 항상 같은 결과를 돌려준다.
+    """
+
+    def __init__(self, names):
+        self.nodes = frozenset(names)
+        self._by_name = {}
+        self._by_alias = {}
+        for name in sorted(names):
+            base, aliases, _ = split_node_name(name)
+            self._by_name.setdefault(normalize_station_name(base), []).append(name)
+            for alias in aliases:
+                self._by_alias.setdefault(normalize_station_name(alias), []).append(name)
+
+    def lookup(self, name):
+        """입력 이름(노드ID, 역 이름, 부역명)에 해당하는 모든 노드ID 목록 (없으면 [])"""
+        if name in self.nodes:
+            return [name]
+        key = normalize_station_name(name)
+        found = self._by_name.get(key) or self._by_alias.get(key)
+        if not found and "(" in name:
+            # "미금(분당서울대병원)"처럼 괄호 안 부역명으로 입력한 경우
+            for alias in name.split("(")[1:]:
+                found = self._by_alias.get(normalize_station_name(alias.rstrip(")")))
+                if found:
+                    break
+        return list(found or [])
+
+    def resolve(self, name):
+        """대표 노드ID 하나 (이름순 첫 번째, 없으면 None)"""
+        found = self.lookup(name)
+        return found[0] if found else None
+
+    def __len__(self):
+        return len(self._by_name)
@@ -0,0 +1,643 @@
+import csv
+import heapq
+import math
+import threading
+from array import array
+from collections import OrderedDict
+
+
+# 지하철 평균 속도(km/h)
+AVG_SPEED_KMH = 34
+
+# 지구 평균 반지름(km)
+EARTH_RADIUS_KM = 6371.0088
+
+INF = float("inf")
+
+# 가중치 프로필: 탐색에 사용할 간선 비용 종류
+WEIGHT_PROFILES = ("time", "distance")
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """두 위경도 좌표 사이의 대원 거리(km)"""
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    h = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+# =========================
+# 불변 그래프 (정수 인덱스 + CSR 인접 배열)
+# =========================
+class SubwayGraph:
+    """
+    역 이름을 0..n-1 정수로 바꾸고 인접 정보를 CSR 배열로 저장하는 불변 그래프.
+      - offsets[i] ~ offsets[i+1]: i번 노드에서 나가는 간선 구간
+      - targets / dist_km / time_min: 각 간선의 도착 노드, 거리(km), 시간(분)
+    탐색 중 바뀌는 비용·방문 상태는 쿼리마다 만드는 Dijkstra 객체가 따로 가지므로
+    하나의 SubwayGraph를 여러 세션·스레드가 잠금이나 복사 없이 함께 사용할 수 있다.
+    역 이름은 names/index로만 변환하며, 탐색 내부는 모두 정수 인덱스로 동작한다.
+    """
+
+    def __init__(self, nodes, edges, subwayLoc=None, speed_kmh=AVG_SPEED_KMH):
+        # edges: [(노드 a, 노드 b, 거리(km)), ...], 무방향
+        self.speed_kmh = speed_kmh
+        self.names = sorted(nodes)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.nodes = frozenset(self.names)
+        n = len(self.names)
+
+        # 노드별 차수 계산 후 CSR 오프셋 구성 (간선은 양방향으로 2번 저장)
+        degree = [0] * n
+        for a, b, _ in edges:
+            degree[self.index[a]] += 1
+            degree[self.index[b]] += 1
+        offsets = array("i", [0]) * (n + 1)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + degree[i]
+
+        m = offsets[n]
+        targets = array("i", [0]) * m
+        dist_km = array("d", [0.0]) * m
+        time_min = array("d", [0.0]) * m
+        fill = array("i", offsets[:n])
+        for a, b, km in edges:
+            ia, ib = self.index[a], self.index[b]
+            minutes = km * 60.0 / speed_kmh
+            for u, v in ((ia, ib), (ib, ia)):
+                k = fill[u]
+                targets[k] = v
+                dist_km[k] = km
+                time_min[k] = minutes
+                fill[u] = k + 1
+
+        self.offsets = offsets
+        self.targets = targets
+        self.dist_km = dist_km
+        self.time_min = time_min
+
+        # A* 휴리스틱용 좌표 (인덱스별 위도/경도, has_coord[i] == 1 인 노드만 유효)
+        lat = array("d", [0.0]) * n
+        lng = array("d", [0.0]) * n
+        has_coord = bytearray(n)
+        for i, name in enumerate(self.names):
+            loc = (subwayLoc or {}).get(name.split("(")[0])
+            if loc is not None:
+                lat[i], lng[i] = loc[0], loc[1]
+                has_coord[i] = 1
+        self.lat = lat
+        self.lng = lng
+        self.has_coord = has_coord
+        self.heuristic_scale = self._calibrateScale() if any(has_coord) else 0.0
+
+    @classmethod
+    def fromArrays(cls, names, offsets, targets, dist_km, time_min,
+                   lat, lng, has_coord, heuristic_scale, speed_kmh=AVG_SPEED_KMH):
+        """미리 계산된 CSR 배열(예: graph_artifact 파일)로 그래프를 바로 구성"""
+        graph = cls.__new__(cls)
+        graph.speed_kmh = speed_kmh
+        graph.names = list(names)
+        graph.index = {name: i for i, name in enumerate(graph.names)}
+        graph.nodes = frozenset(graph.names)
+        graph.offsets = array("i", offsets)
+        graph.targets = array("i", targets)
+        graph.dist_km = array("d", dist_km)
+        graph.time_min = array("d", time_min)
+        graph.lat = array("d", lat)
+        graph.lng = array("d", lng)
+        graph.has_coord = bytearray(has_coord)
+        graph.heuristic_scale = heuristic_scale
+        return graph
+
+    @property
+    def size(self):
+        return len(self.names)
+
+    def neighbors(self, u):
+        """u번 노드의 (이웃 인덱스, 시간(분)) 목록"""
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[lo:hi], self.time_min[lo:hi])
+
+    def weights(self, profile="time"):
+        """가중치 프로필별 간선 비용 배열 (time: 분, distance: km)"""
+        if profile == "time":
+            return self.time_min
+        if profile == "distance":
+            return self.dist_km
+        raise ValueError(f"알 수 없는 가중치 프로필: {profile}")
+
+    def edgeBetween(self, u, v):
+        """u-v 간선 중 시간이 가장 짧은 간선의 CSR 위치 (없으면 -1)"""
+        best = -1
+        for k in range(self.offsets[u], self.offsets[u + 1]):
+            if self.targets[k] == v and (best < 0 or self.time_min[k] < self.time_min[best]):
+                best = k
+        return best
+
+    def straightTime(self, a, b):
+        # 좌표 직선거리(km)를 평균 속도로 환산한 시간(분)
+        km = haversine_km(self.lat[a], self.lng[a], self.lat[b], self.lng[b])
+        return km * 60.0 / self.speed_kmh
+
+    def _calibrateScale(self):
+        """
+        직선거리 시간에 곱할 배율을 구한다.
+        역간거리 데이터가 직선거리보다 짧은 구간이 있으면 휴리스틱이 실제 비용을
+        넘어설 수 있으므로, 좌표가 있는 역 사이의 모든 구간(좌표 없는 역 경유 포함)에서
+        "구간 비용 / 직선거리 시간"의 최솟값으로 배율을 낮춰 하한을 보장한다.
+        """
+        scale = 1.0
+        for src in range(self.size):
+            if not self.has_coord[src]:
+                continue
+            # 좌표가 없는 역만 경유해서 닿는 좌표 보유 역까지의 최단 비용
+            best = {src: 0}
+            heap = [(0, src)]
+            while heap:
+                c, u = heapq.heappop(heap)
+                if c > best[u]:
+                    continue
+                if u != src and self.has_coord[u]:
+                    straight = self.straightTime(src, u)
+                    if straight > 0:
+                        scale = min(scale, c / straight)
+                    continue
+                for v, w in self.neighbors(u):
+                    if c + w < best.get(v, INF):
+                        best[v] = c + w
+                        heapq.heappush(heap, (c + w, v))
+        return scale
+
+    def heuristic(self, node, end):
+        if not self.has_coord[node]:
+            return 0.0
+        return self.heuristic_scale * self.straightTime(node, end)
+
+    def pathNames(self, path):
+        """인덱스 경로 -> 역 이름 경로 (UI 경계에서만 사용)"""
+        return [self.names[i] for i in path]
+
+
+# =========================
+# Dijkstra 알고리즘 클래스 (쿼리별 탐색 상태)
+# =========================
+class Dijkstra:
+    """
+    공유 SubwayGraph 위에서 한 번의 탐색 상태(dist, parent)를 담는 객체.
+    쿼리(또는 스레드)마다 새로 만들어 사용한다.
+    getPath 등은 역 이름을 받아 역 이름 경로를 돌려주고, 내부 탐색은 정수 인덱스로 한다.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.nodes = graph.nodes
+        self.reset()
+
+    def reset(self):
+        n = self.graph.size
+        # dist[i]: i번 노드까지의 최소 비용, parent[i]: 부모 노드 인덱스 (-1: 없음)
+        self.dist = [INF] * n
+        self.parent = [-1] * n
+        self.visited = bytearray(n)
+        # 마지막 탐색에서 확정(힙에서 꺼내 처리)한 노드 수
+        self.settled = 0
+
+    def costTo(self, name):
+        """마지막 탐색 기준 name까지의 최소 비용(분)"""
+        return self.dist[self.graph.index[name]]
+
+    def getPath(self, start, end, astar=False, landmarks=None):
+        """
+        start -> end 최단 경로 (end가 확정되는 즉시 탐색 종료).
+        astar=True 이면 좌표 직선거리 하한을 이용한 A* 탐색.
+        landmarks(landmarks.LandmarkIndex)가 주어지면 랜드마크 삼각부등식 하한으로 A* 탐색 (ALT).
+        """
+        graph = self.graph
+        s, t = graph.index[start], graph.index[end]
+        offsets, targets, weights = graph.offsets, graph.targets, graph.time_min
+        dist, parent, visited = self.dist, self.parent, self.visited
+        bounds = landmarks.boundsTo(t) if landmarks is not None else None
+        use_heuristic = bounds is None and astar and graph.has_coord[t] and graph.heuristic_scale > 0
+
+        dist[s] = 0
+        if bounds is not None:
+            heap = [(bounds[s], s)]
+        else:
+            heap = [(graph.heuristic(s, t) if use_heuristic else 0, s)]
+        while heap:
+            _, u = heapq.heappop(heap)
+            if visited[u]:
+                continue
+            visited[u] = 1
+            self.settled += 1
+            if u == t:
+                break
+
+            du = dist[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = du + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    # 좌표가 없는 역은 휴리스틱이 0이라 일관성이 깨질 수 있으므로 재방문 허용
+                    visited[v] = 0
+                    if bounds is not None:
+                        key = nd + bounds[v]
+                    else:
+                        key = nd + graph.heuristic(v, t) if use_heuristic else nd
+                    heapq.heappush(heap, (key, v))
+
+        return graph.pathNames(self._reconstruct(s, t))
+
+    def getPathBidirectional(self, start, end):
+        """
+        start와 end 양쪽에서 동시에 탐색하는 양방향 Dijkstra.
+        두 탐색의 힙 최솟값 합이 지금까지 찾은 최단 비용 이상이 되면 최적이 보장되므로 종료한다.
+        비용은 단방향 탐색과 같지만, 같은 비용의 경로가 여럿이면 만난 지점에 따라
+        단방향 탐색과 다른 경로를 반환할 수 있다 (정방향 거리를 모르므로 같은 규칙으로 고를 수 없음).
+        """
+        graph = self.graph
+        s, t = graph.index[start], graph.index[end]
+        offsets, targets, weights = graph.offsets, graph.targets, graph.time_min
+        dist, parent, visited = self.dist, self.parent, self.visited
+
+        dist[s] = 0
+        if s == t:
+            visited[s] = 1
+            self.settled += 1
+            return [start]
+
+        # 역방향 탐색 상태: end까지의 비용, end 쪽 부모, 부모로 가는 간선의 CSR 위치
+        n = graph.size
+        bdist = [INF] * n
+        bparent = [-1] * n
+        bedge = [-1] * n
+        bvisited = bytearray(n)
+        bdist[t] = 0
+        fwd_heap = [(0, s)]
+        bwd_heap = [(0, t)]
+        best = INF
+        meet = -1
+
+        while True:
+            # 이미 확정된 노드의 오래된 힙 항목 제거
+            while fwd_heap and visited[fwd_heap[0][1]]:
+                heapq.heappop(fwd_heap)
+            while bwd_heap and bvisited[bwd_heap[0][1]]:
+                heapq.heappop(bwd_heap)
+            fwd_top = fwd_heap[0][0] if fwd_heap else INF
+            bwd_top = bwd_heap[0][0] if bwd_heap else INF
+            if fwd_top + bwd_top >= best or (not fwd_heap and not bwd_heap):
+                break
+
+            if fwd_top <= bwd_top:
+                du, u = heapq.heappop(fwd_heap)
+                visited[u] = 1
+                self.settled += 1
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    nd = du + weights[k]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        parent[v] = u
+                        heapq.heappush(fwd_heap, (nd, v))
+                        if nd + bdist[v] < best:
+                            best = nd + bdist[v]
+                            meet = v
+            else:
+                du, u = heapq.heappop(bwd_heap)
+                bvisited[u] = 1
+                self.settled += 1
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    nd = du + weights[k]
+                    if nd < bdist[v]:
+                        bdist[v] = nd
+                        bparent[v] = u
+                        bedge[v] = k
+                        heapq.heappush(bwd_heap, (nd, v))
+                        if nd + dist[v] < best:
+                            best = nd + dist[v]
+                            meet = v
+
+        if meet < 0:
+            return []  # 도달 불가
+
+        # 만난 지점 -> end 구간을 정방향 비용/부모로 옮겨 적어 경로 복원을 공유
+        prev = meet
+        v = bparent[meet]
+        while v >= 0:
+            dist[v] = dist[prev] + weights[bedge[prev]]
+            parent[v] = prev
+            prev = v
+            v = bparent[v]
+
+        return graph.pathNames(self._reconstruct(s, t))
+
+    def getTree(self, start, profile="time"):
+        """start에서 도달 가능한 모든 노드를 확정 (dist/parent에 최단 비용/부모 기록)"""
+        self.getTreeMulti({start: 0}, profile)
+
+    def _seed(self, sources):
+        """다중 출발: {역 이름: 시작 비용(분)}을 dist에 넣고 초기 힙 반환 (출발역의 parent는 -1)"""
+        index, dist = self.graph.index, self.dist
+        heap = []
+        for name, cost in sources.items():
+            s = index[name]
+            if cost < dist[s]:
+                dist[s] = cost
+                heap.append((cost, s))
+        heapq.heapify(heap)
+        return heap
+
+    def getTreeMulti(self, sources, profile="time"):
+        """
+        여러 출발역에서 동시에 시작하는 전체 탐색 (sources: {역 이름: 시작 비용(분)}).
+        가상 출발점에서 각 역으로 시작 비용(예: 도보 시간)만큼의 간선이 있는 것과 같다.
+        """
+        graph = self.graph
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights(profile)
+        dist, parent, visited = self.dist, self.parent, self.visited
+
+        heap = self._seed(sources)
+        while heap:
+            du, u = heapq.heappop(heap)
+            # 이미 확정된 노드의 오래된 힙 항목은 건너뜀
+            if visited[u]:
+                continue
+            visited[u] = 1
+            self.settled += 1
+
+            # 인접 노드까지의 비용 갱신
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = du + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd, v))
+
+    def getWithin(self, start, budget, profile="time"):
+        """
+        start에서 비용 budget(분) 이내로 도달 가능한 역만 확정하는 제한 탐색 (isochrone).
+        budget을 넘는 간선 완화는 힙에 넣지 않으므로 예산 밖 노드는 확정도 확장도 하지 않는다.
+        반환: {역 이름: 최소 비용} (확정 순서 = 비용 오름차순)
+        """
+        graph = self.graph
+        s = graph.index[start]
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights(profile)
+        dist, parent, visited = self.dist, self.parent, self.visited
+
+        reached = {}
+        dist[s] = 0
+        heap = [(0, s)]
+        while heap:
+            du, u = heapq.heappop(heap)
+            if visited[u]:
+                continue
+            visited[u] = 1
+            self.settled += 1
+            reached[graph.names[u]] = du
+
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = du + weights[k]
+                if nd <= budget and nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd, v))
+        return reached
+
+    def getPathMulti(self, sources, destinations):
+        """
+        여러 출발역과 여러 도착역 사이의 최단 경로를 한 번의 탐색으로 구한다.
+        sources/destinations: {역 이름: 도보 등 추가 비용(분)} — 출발 비용은 시작 dist로,
+        도착 비용은 도착역에서 가상 도착점으로 가는 간선으로 본다.
+        확정된 노드의 비용이 지금까지의 최선(도착역 dist + 도착 비용) 이상이면 종료.
+        반환: 고른 출발역 -> 도착역 역 이름 경로 (도달 불가면 [])
+        """
+        graph = self.graph
+        index = graph.index
+        offsets, targets, weights = graph.offsets, graph.targets, graph.time_min
+        dist, parent, visited = self.dist, self.parent, self.visited
+        exits = {index[name]: cost for name, cost in destinations.items()}
+
+        best, best_t = INF, -1
+        heap = self._seed(sources)
+        while heap:
+            du, u = heapq.heappop(heap)
+            if visited[u]:
+                continue
+            if du >= best:
+                break
+            visited[u] = 1
+            self.settled += 1
+            if u in exits and du + exits[u] < best:
+                best, best_t = du + exits[u], u
+
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = du + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd, v))
+
+        if best_t < 0:
+            return []
+        return graph.pathNames(self._reconstruct(-1, best_t))
+
+    def pathTo(self, start, end):
+        """마지막 탐색(getTree 등) 결과로 start -> end 역 이름 경로 복원"""
+        graph = self.graph
+        return graph.pathNames(self._reconstruct(graph.index[start], graph.index[end]))
+
+    def _reconstruct(self, s, t):
+        # s -> t 인덱스 경로 복원 (s가 -1이면 다중 출발 탐색의 출발역까지)
+        if self.dist[t] == INF:
+            return []  # 도달 불가
+
+        path = [t]
+        cur = t
+        while cur != s:
+            cur = self.parent[cur]
+            if cur < 0:
+                break
+            path.append(cur)
+
+        return path[::-1]
+
+
+# =========================
+# 단일 출발 최단 경로 트리 + LRU 캐시
+# =========================
+class ShortestPathTree:
+    """
+    한 출발역에서 모든 역까지의 최단 비용(dist)과 부모(parent) 배열 (읽기 전용).
+    경로는 parent를 따라 O(경로 길이)로 복원한다.
+    """
+
+    __slots__ = ("graph", "source", "profile", "dist", "parent")
+
+    def __init__(self, graph, source, profile, dist, parent):
+        self.graph = graph
+        self.source = source
+        self.profile = profile
+        self.dist = array("d", dist)
+        self.parent = array("i", parent)
+
+    def costTo(self, name):
+        return self.dist[self.graph.index[name]]
+
+    def pathTo(self, name):
+        """출발역 -> name 역 이름 경로 (도달 불가면 [])"""
+        t = self.graph.index[name]
+        if self.dist[t] == INF:
+            return []
+        path = [t]
+        while self.parent[path[-1]] >= 0:
+            path.append(self.parent[path[-1]])
+        return self.graph.pathNames(path[::-1])
+
+
+def shortest_path_tree(graph, start, profile="time"):
+    """start에서 전체 탐색을 한 번 수행해 ShortestPathTree로 반환"""
+    dijkstra = Dijkstra(graph)
+    dijkstra.getTree(start, profile)
+    return ShortestPathTree(graph, start, profile, dijkstra.dist, dijkstra.parent)
+
+
+def multi_source_tree(graph, sources, profile="time"):
+    """
+    여러 출발역({역 이름: 시작 비용(분)})에서 한 번의 탐색으로 만든 ShortestPathTree.
+    dist에는 시작 비용이 포함되고, pathTo는 가장 유리한 출발역부터의 경로를 돌려준다.
+    """
+    dijkstra = Dijkstra(graph)
+    dijkstra.getTreeMulti(sources, profile)
+    return ShortestPathTree(graph, tuple(sources), profile, dijkstra.dist, dijkstra.parent)
+
+
+class TreeCache:
+    """
+    (출발역, 가중치 프로필) -> ShortestPathTree 를 최대 maxsize개까지 보관하는 LRU 캐시.
+    세션·스레드 간에 공유해도 되도록 잠금으로 보호한다.
+    matrix(time_matrix.TimeMatrix)가 주어지면 시간 프로필은 탐색 없이 행렬의 행을 돌려준다.
+    """
+
+    def __init__(self, graph, maxsize=256, matrix=None):
+        self.graph = graph
+        self.maxsize = maxsize
+        self.matrix = matrix
+        self.hits = 0
+        self.misses = 0
+        self._trees = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, start, profile="time"):
+        if self.matrix is not None and profile == "time":
+            return self.matrix.tree(start)
+        key = (start, profile)
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                self.hits += 1
+                return tree
+            self.misses += 1
+
+        # 탐색은 잠금 밖에서 수행 (같은 키를 동시에 계산해도 결과가 같으므로 무해)
+        tree = shortest_path_tree(self.graph, start, profile)
+        with self._lock:
+            self._trees[key] = tree
+            self._trees.move_to_end(key)
+            while len(self._trees) > self.maxsize:
+                self._trees.popitem(last=False)
+        return tree
+
+    def getMany(self, starts, profile="time"):
+        """여러 출발역의 트리를 {출발역: ShortestPathTree}로 반환 (중복 출발역은 한 번만 계산)"""
+        if self.matrix is not None and profile == "time":
+            return {start: self.matrix.tree(start) for start in starts}
+        trees = {}
+        missing = []
+        with self._lock:
+            for start in dict.fromkeys(starts):
+                tree = self._trees.get((start, profile))
+                if tree is None:
+                    missing.append(start)
+                    self.misses += 1
+                    continue
+                self._trees.move_to_end((start, profile))
+                self.hits += 1
+                trees[start] = tree
+
+        # 탐색은 잠금 밖에서 수행
+        computed = [shortest_path_tree(self.graph, start, profile) for start in missing]
+
+        with self._lock:
+            for start, tree in zip(missing, computed):
+                trees[start] = tree
+                self._trees[(start, profile)] = tree
+                self._trees.move_to_end((start, profile))
+            while len(self._trees) > self.maxsize:
+                self._trees.popitem(last=False)
+        return trees
+
+    def __len__(self):
+        return len(self._trees)
+
+
+def get_path_distance_and_time(pathList, graph):
+    """
+    pathList(노드ID 리스트)에 대해
+    총 거리(km)와 총 시간(분)을 계산
+    """
+    total_dist = 0.0
+    total_time = 0.0
+    index = graph.index
+    for i in range(len(pathList) - 1):
+        k = graph.edgeBetween(index[pathList[i]], index[pathList[i + 1]])
+        if k < 0:
+            continue
+        total_dist += graph.dist_km[k]
+        total_time += graph.time_min[k]
+    return total_dist, total_time
+
+
+# =========================
+# 데이터 로딩
+# =========================
+
+def load_subway_network(subway_csv, location_csv, avg_speed_kmh=AVG_SPEED_KMH):
+    """
+    지하철역 위치 및 연결 정보를 로드
+    반환: (subwayLoc, nodes, SubwayGraph)
+    """
+    subwayLoc = {}
+    nodes = set()
+    edges = []
+
+    # 지하철역 위치 정보 로드
+    with open(location_csv, 'r', encoding='utf-8-sig') as f:
+        rdr = csv.reader(f)
+        for line in rdr:
+            # line[0]: 역 이름, line[1]: 위도, line[2]: 경도
+            if line[0] not in subwayLoc:
+                subwayLoc[line[0]] = [float(line[1]), float(line[2])]
+
+    # 지하철역 간 연결 정보 로드 (3번째 컬럼이 거리(km)라고 가정)
+    with open(subway_csv, 'r', encoding='utf-8-sig') as f:
+        rdr = csv.reader(f)
+        for line in rdr:
+            n1, n2 = line[0], line[1]
+            nodes.add(n1)
+            nodes.add(n2)
+            edges.append((n1, n2, float(line[2])))
+
+    # 그래프 구성 (weight = 시간(분), 거리(km) -> 시간(분) 환산은 SubwayGraph에서)
+    graph = SubwayGraph(nodes, edges, subwayLoc, avg_speed_kmh)
+
+    return subwayLoc, graph.nodes, graph
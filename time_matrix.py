@@ -0,0 +1,166 @@
+import numpy as np
+
+from graph_artifact import write_atomic
+from subway_routing import INF, Dijkstra
+
+# 행렬 파일 형식: [헤더 HEADER_SIZE바이트][시간 float32 n*n][next-hop int16 n*n]
+#   헤더 = 매직(8) + 노드 수 uint32(4) + 원본 해시 ascii(64), 나머지는 0으로 채움
+MATRIX_MAGIC = b"SUBWMTX1"
+HEADER_SIZE = 128
+# next-hop을 int16으로 저장하므로 노드 인덱스가 이 값을 넘는 그래프는 행렬로 만들 수 없다
+MAX_MATRIX_NODES = int(np.iinfo(np.int16).max)
+
+
+class MatrixTree:
+    """
+    시간 행렬의 한 행을 ShortestPathTree처럼 쓰기 위한 읽기 전용 뷰.
+    dist는 memmap 행(float32)이라 복사하지 않고, 경로는 next-hop을 따라 복원한다.
+    """
+
+    __slots__ = ("matrix", "graph", "source", "profile", "dist")
+
+    def __init__(self, matrix, source):
+        self.matrix = matrix
+        self.graph = matrix.graph
+        self.source = source
+        self.profile = "time"
+        self.dist = matrix.times[matrix.graph.index[source]]
+
+    def costTo(self, name):
+        return float(self.dist[self.graph.index[name]])
+
+    def pathTo(self, name):
+        return self.matrix.pathTo(self.source, name)
+
+
+class TimeMatrix:
+    """
+    모든 역 쌍의 최단 소요 시간(float32)과 next-hop(int16) 행렬.
+      - times[s, t]: s -> t 최단 소요 시간(분), 도달 불가면 inf
+      - next_hop[s, t]: s -> t 최단 경로에서 s 다음 노드 인덱스 (s == t 또는 도달 불가면 -1)
+    memmap으로 열어 여러 프로세스가 같은 페이지 캐시를 복사 없이 공유한다.
+    """
+
+    def __init__(self, graph, times, next_hop, path=None):
+        self.graph = graph
+        self.times = times
+        self.next_hop = next_hop
+        self.path = path
+
+    def __reduce__(self):
+        # 프로세스 풀로 넘길 때는 배열 대신 파일 경로만 보내 작업자에서 다시 memmap
+        if self.path is None:
+            return TimeMatrix, (self.graph, self.times, self.next_hop)
+        return open_time_matrix, (self.path, self.graph)
+
+    def costTo(self, start, end):
+        index = self.graph.index
+        return float(self.times[index[start], index[end]])
+
+    def pathTo(self, start, end):
+        """start -> end 역 이름 경로 (도달 불가면 [])"""
+        index = self.graph.index
+        u, t = index[start], index[end]
+        if self.times[u, t] == INF:
+            return []
+        path = [u]
+        while u != t:
+            u = int(self.next_hop[u, t])
+            path.append(u)
+        return self.graph.pathNames(path)
+
+    def tree(self, start):
+        return MatrixTree(self, start)
+
+
+def build_time_matrix(graph):
+    """
+    모든 역에서 전체 탐색을 한 번씩 수행해 (times, next_hop) 배열을 만든다.
+    그래프가 무방향이므로 t를 루트로 한 트리의 parent[s]가 곧 s -> t의 next-hop이다.
+    """
+    n = graph.size
+    if n > MAX_MATRIX_NODES:
+        raise ValueError(
+            f"노드 {n}개는 int16 next-hop 행렬의 한도({MAX_MATRIX_NODES}개)를 넘습니다."
+        )
+    times = np.empty((n, n), dtype=np.float32)
+    next_hop = np.empty((n, n), dtype=np.int16)
+    for t, name in enumerate(graph.names):
+        dijkstra = Dijkstra(graph)
+        dijkstra.getTree(name)
+        times[t] = dijkstra.dist  # 무방향이므로 times[t, s] == times[s, t]
+        next_hop[:, t] = dijkstra.parent
+    return times, next_hop
+
+
+def save_time_matrix(path, times, next_hop, key):
+    """
+    헤더 + 두 행렬을 하나의 파일로 기록 (임시 파일에 쓴 뒤 교체하므로
+    동시에 기동한 다른 프로세스가 헤더만 있고 행렬이 덜 쓰인 파일을 열지 않는다)
+    """
+    n = times.shape[0]
+    header = bytearray(HEADER_SIZE)
+    header[:8] = MATRIX_MAGIC
+    header[8:12] = np.uint32(n).tobytes()
+    header[12:76] = key.encode("ascii")
+
+    def write(f):
+        f.write(header)
+        f.write(np.ascontiguousarray(times, dtype=np.float32).tobytes())
+        f.write(np.ascontiguousarray(next_hop, dtype=np.int16).tobytes())
+
+    write_atomic(path, write)
+
+
+def read_header(path):
+    """(노드 수, 원본 해시)를 반환, 형식이 다르면 None"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+    except OSError:
+        return None
+    if len(header) != HEADER_SIZE or header[:8] != MATRIX_MAGIC:
+        return None
+    n = int(np.frombuffer(header[8:12], dtype=np.uint32)[0])
+    return n, header[12:76].decode("ascii")
+
+
+def open_time_matrix(path, graph):
+    """헤더 검사 없이 파일을 읽기 전용 memmap으로 연다."""
+    n = graph.size
+    times = np.memmap(path, dtype=np.float32, mode="r", offset=HEADER_SIZE, shape=(n, n))
+    next_hop = np.memmap(
+        path, dtype=np.int16, mode="r", offset=HEADER_SIZE + 4 * n * n, shape=(n, n)
+    )
+    return TimeMatrix(graph, times, next_hop, path)
+
+
+def load_time_matrix(path, graph, key):
+    """
+    행렬 파일이 있고 원본 해시/노드 수가 같으면 TimeMatrix, 아니면 None
+    (헤더는 맞지만 파일이 잘려 열 수 없는 경우도 None)
+    """
+    header = read_header(path)
+    if header is None or header != (graph.size, key):
+        return None
+    try:
+        return open_time_matrix(path, graph)
+    except (OSError, ValueError):
+        return None
+
+
+def load_or_build_time_matrix(path, graph, key):
+    """
+    해시가 같은 행렬 파일이 있으면 memmap으로 열고,
+    없으면 새로 만들어 저장한 뒤 연다 (저장할 수 없으면 메모리 배열 그대로 사용).
+    """
+    matrix = load_time_matrix(path, graph, key)
+    if matrix is not None:
+        return matrix
+
+    times, next_hop = build_time_matrix(graph)
+    try:
+        save_time_matrix(path, times, next_hop, key)
+    except OSError:
+        return TimeMatrix(graph, times, next_hop)  # 읽기 전용 배포 환경
+    return open_time_matrix(path, graph)